@@ -0,0 +1,65 @@
+"""Bake the SVG category JSON into an importable Python module.
+
+Usage:
+    python bake_svg_categories.py
+
+Parsing the category JSON costs json.loads plus container construction on
+every cold start; importing a pre-baked .pyc is an order of magnitude
+faster for the same data. The baked module records the source file's
+modification time so the loader can detect a stale bake and fall back to
+the JSON.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SOURCE_JSON = (
+    REPO_ROOT
+    / "python/pixelpouch/houdini/tools/icon_browser/data/svg_category_map.json"
+)
+BAKED_MODULE = (
+    REPO_ROOT / "python/pixelpouch/houdini/ops/_svg_categories_baked.py"
+)
+
+HEADER = '''"""Baked SVG category map. Generated by bin/bake_svg_categories.py.
+
+Do not edit by hand; regenerate after changing svg_category_map.json.
+"""
+'''
+
+
+def bake(source_json: Path, baked_module: Path) -> None:
+    """Write the baked category module from the JSON source.
+
+    Args:
+        source_json: Path to the category definition JSON.
+        baked_module: Path of the generated Python module.
+    """
+    raw: dict[str, list[str]] = json.loads(source_json.read_bytes())
+
+    lines = [HEADER]
+    lines.append(f"SOURCE_MTIME_NS = {source_json.stat().st_mtime_ns}")
+    lines.append("")
+    lines.append("CATEGORY_MAP: dict[str, tuple[str, ...]] = {")
+    for category, folders in raw.items():
+        lines.append(f"    {category!r}: {tuple(folders)!r},")
+    lines.append("}")
+    lines.append("")
+
+    baked_module.write_text("\n".join(lines), encoding="utf-8")
+
+
+def main() -> int:
+    if not SOURCE_JSON.is_file():
+        print(f"Category JSON not found: {SOURCE_JSON}", file=sys.stderr)
+        return 1
+
+    bake(SOURCE_JSON, BAKED_MODULE)
+    print(f"Baked {SOURCE_JSON.name} -> {BAKED_MODULE}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
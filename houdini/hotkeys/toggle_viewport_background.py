@@ -1,5 +1,11 @@
 import hou
 
+_NEXT_SCHEME = {
+    hou.viewportColorScheme.Dark: hou.viewportColorScheme.Grey,
+    hou.viewportColorScheme.Grey: hou.viewportColorScheme.Light,
+    hou.viewportColorScheme.Light: hou.viewportColorScheme.Dark,
+}
+
 pane = hou.ui.paneTabUnderCursor()
 if not pane or pane.type() != hou.paneTabType.SceneViewer:
     pane = hou.ui.curDesktop().paneTabOfType(hou.paneTabType.SceneViewer)
@@ -12,9 +18,4 @@ viewport: hou.SceneViewer = pane.curViewport()
 settings: hou.GeometryViewportSettings = viewport.settings()
 color_scheme: hou.EnumValue = settings.colorScheme()
 
-if color_scheme == hou.viewportColorScheme.Dark:
-    settings.setColorScheme(hou.viewportColorScheme.Grey)
-elif color_scheme == hou.viewportColorScheme.Grey:
-    settings.setColorScheme(hou.viewportColorScheme.Light)
-else:
-    settings.setColorScheme(hou.viewportColorScheme.Dark)
+settings.setColorScheme(_NEXT_SCHEME.get(color_scheme, hou.viewportColorScheme.Dark))
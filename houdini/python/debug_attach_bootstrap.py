@@ -5,9 +5,10 @@ Houdini debugging is enabled via an environment variable. It is intended to be
 used as a lightweight bootstrap script.
 """
 
-from typing import Optional
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
-from pixelpouch.libs.core.debug import DebugpyRuntime, ProcessWatchdog
 from pixelpouch.libs.core.environment_variable_key import (
     ExecutionContextEnv,
     PixelPouchEnv,
@@ -16,12 +17,15 @@ from pixelpouch.libs.core.environment_variable_key import (
 from pixelpouch.libs.core.houdini import HoudiniEnvironmentVariables
 from pixelpouch.libs.core.logging_factory import PixelPouchLoggerFactory
 
+if TYPE_CHECKING:
+    from pixelpouch.libs.core.debug import DebugpyRuntime
+
 logger = PixelPouchLoggerFactory.get_logger(__name__)
 HOU_ENV = HoudiniEnvironmentVariables()
 PP_ENV = PixelPouchEnvironmentVariables()
 
 
-_RUNTIME: Optional[DebugpyRuntime] = None
+_RUNTIME: Optional["DebugpyRuntime"] = None
 
 
 def main() -> None:
@@ -39,12 +43,23 @@ def main() -> None:
         PP_ENV.PIXELPOUCH_ENV == PixelPouchEnv.DEV
         and PP_ENV.PIXELPOUCH_EXECUTION_CONTEXT == ExecutionContextEnv.HOUDINI
     ):
+        # Deferred: pixelpouch.libs.core.debug pulls in the debugpy stack,
+        # which is pure startup cost when the debugger is disabled.
+        from pixelpouch.libs.core.debug import DebugpyRuntime, ProcessWatchdog
+
+        # hython sets sys.executable to the running interpreter, which is
+        # always correct for debugpy.configure; the HYTHON_LOCATION env var
+        # is only a fallback for embedded contexts where it is empty.
+        python_location = (
+            Path(sys.executable) if sys.executable else HOU_ENV.HYTHON_LOCATION
+        )
+
         ready_file = PP_ENV.PIXELPOUCH_LOCAL_DATA_DIR / ".debugpy_ready"
 
         ProcessWatchdog(process_name="houdini.exe", ready_file=ready_file).start()
         global _RUNTIME
         _RUNTIME = DebugpyRuntime(
-            python_location=HOU_ENV.HYTHON_LOCATION,
+            python_location=python_location,
             host=PP_ENV.PIXELPOUCH_HOST,
             port=PP_ENV.PIXELPOUCH_PORT,
             ready_file=ready_file,
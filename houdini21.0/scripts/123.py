@@ -15,6 +15,7 @@ except ImportError:
 
 if ENABLE_PIXELPOUCH:
     import debug_attach_bootstrap
+    import hou
     from pixelpouch.libs.core.debug.server import SendPythonServer
     from pixelpouch.libs.core.environment_variable_key import (
         PixelPouchEnvironmentVariables,
@@ -23,16 +24,25 @@ if ENABLE_PIXELPOUCH:
 
     logger = PixelPouchLoggerFactory.get_logger(__name__)
 
-    #: PixelPouch environment variable accessor initialized from the current
-    #: process environment.
-    PP_ENV = PixelPouchEnvironmentVariables()
+    # Guard against accidental double-include of this startup script (e.g.
+    # when several HOUDINI_PATH entries ship a 123.py): bootstrapping twice
+    # would start the send server and debugpy runtime twice.
+    if getattr(hou.session, "_pixelpouch_booted", False):
+        logger.debug("[Houdini] PixelPouch already bootstrapped; skipping")
+    else:
+        #: PixelPouch environment variable accessor initialized from the
+        #: current process environment.
+        PP_ENV = PixelPouchEnvironmentVariables()
 
-    if not PP_ENV.PIXELPOUCH_LOCAL_DATA_DIR.exists():
-        PP_ENV.PIXELPOUCH_LOCAL_DATA_DIR.mkdir()
+        local_data_dir = PP_ENV.PIXELPOUCH_LOCAL_DATA_DIR
+        if not local_data_dir.exists():
+            local_data_dir.mkdir()
 
-    if PP_ENV.PIXELPOUCH_DEBUGGER_ENABLE:
-        server = SendPythonServer(port=7001)
-        server.start()
+        if PP_ENV.PIXELPOUCH_DEBUGGER_ENABLE:
+            server = SendPythonServer(port=7001)
+            server.start()
 
-        logger.info("[Houdini] Houdini debugging")
-        debug_attach_bootstrap.main()
+            logger.info("[Houdini] Houdini debugging")
+            debug_attach_bootstrap.main()
+
+        hou.session._pixelpouch_booted = True
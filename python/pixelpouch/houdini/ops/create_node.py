@@ -1,15 +1,12 @@
 import hou
+from pixelpouch.houdini.ops.panes import resolve_pane
 from pixelpouch.libs.core.logging_factory import PixelPouchLoggerFactory
 
 logger = PixelPouchLoggerFactory.get_logger(__name__)
 
 
 def create_node(node_type: str, position: tuple[float, float] = (0, -1.0)) -> None:
-    pane = hou.ui.paneTabUnderCursor()
-    used_fallback = False
-    if not pane or pane.type() != hou.paneTabType.NetworkEditor:
-        pane = hou.ui.curDesktop().paneTabOfType(hou.paneTabType.NetworkEditor)
-        used_fallback = True
+    pane = resolve_pane(hou.paneTabType.NetworkEditor)
 
     if not pane:
         logger.error(
@@ -18,11 +15,6 @@ def create_node(node_type: str, position: tuple[float, float] = (0, -1.0)) -> No
         )
         raise hou.Error("No Network Editor found")
 
-    if used_fallback:
-        logger.warning(
-            "No Network Editor under cursor; using the first available Network Editor."
-        )
-
     obj_node: hou.ObjNode = pane.pwd()
     if not isinstance(obj_node, hou.ObjNode):
         return
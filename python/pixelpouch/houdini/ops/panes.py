@@ -0,0 +1,90 @@
+"""Cached pane tab resolution helpers for Houdini.
+
+This module centralizes the "pane under cursor, else desktop walk" lookup
+used by hotkey-driven operations. HOM pane queries cross the C++/Python
+boundary and dominate hotkey latency, so the last successfully resolved
+pane per type is memoized in a module-level weak reference and revalidated
+cheaply before falling back to the full ``curDesktop().paneTabOfType``
+walk.
+"""
+
+import weakref
+from typing import Optional
+
+import hou
+from pixelpouch.libs.core.logging_factory import PixelPouchLoggerFactory
+
+logger = PixelPouchLoggerFactory.get_logger(__name__)
+
+_LAST_PANES: dict[hou.EnumValue, "weakref.ref[hou.PaneTab]"] = {}
+
+
+def _remember_pane(pane_type: hou.EnumValue, pane: hou.PaneTab) -> None:
+    """Stores a weak reference to the last resolved pane of a given type.
+
+    Args:
+        pane_type: Pane tab type used as the cache key.
+        pane: Pane tab instance to remember.
+    """
+    try:
+        _LAST_PANES[pane_type] = weakref.ref(pane)
+    except TypeError:
+        # Some HOM objects do not support weak references; caching is
+        # best-effort and must never break pane resolution.
+        _LAST_PANES.pop(pane_type, None)
+
+
+def _cached_pane(pane_type: hou.EnumValue) -> Optional[hou.PaneTab]:
+    """Returns the cached pane for a type if it is still valid.
+
+    Args:
+        pane_type: Pane tab type used as the cache key.
+
+    Returns:
+        The cached pane tab if it is alive, still of the requested type,
+        and currently the visible tab of its pane, otherwise ``None``.
+    """
+    ref = _LAST_PANES.get(pane_type)
+    if ref is None:
+        return None
+
+    pane = ref()
+    if pane is not None:
+        try:
+            if pane.type() == pane_type and pane.isCurrentTab():
+                return pane
+        except hou.ObjectWasDeleted:
+            pass
+
+    del _LAST_PANES[pane_type]
+    return None
+
+
+def resolve_pane(pane_type: hou.EnumValue) -> Optional[hou.PaneTab]:
+    """Resolves a pane tab of the given type with last-pane memoization.
+
+    The pane under the mouse cursor is checked first (cheap). If it does
+    not match, the last-known pane of this type is revalidated. Only on a
+    cache miss is the full desktop pane walk performed.
+
+    Args:
+        pane_type: Requested pane tab type (e.g.
+            ``hou.paneTabType.SceneViewer``).
+
+    Returns:
+        A matching pane tab, or ``None`` if none exists in the current UI.
+    """
+    pane = hou.ui.paneTabUnderCursor()
+    if pane and pane.type() == pane_type:
+        _remember_pane(pane_type, pane)
+        return pane
+
+    cached = _cached_pane(pane_type)
+    if cached is not None:
+        logger.debug("Using cached %s pane.", pane_type)
+        return cached
+
+    pane = hou.ui.curDesktop().paneTabOfType(pane_type)
+    if pane is not None:
+        _remember_pane(pane_type, pane)
+    return pane
@@ -1,20 +1,90 @@
 from __future__ import annotations
 
+import functools
+import importlib
 import json
-from typing import TYPE_CHECKING, Mapping
+import os
+from pathlib import Path
+from typing import Mapping, Protocol, cast
 
-from pixelpouch.houdini.ops.svg_grouping import group_svgs_by_folder
 from pixelpouch.libs.core.logging_factory import PixelPouchLoggerFactory
-from pixelpouch.libs.core.utility import load_json
-
-if TYPE_CHECKING:
-    from pathlib import Path
+from pixelpouch.libs.core.utility import open_zip_cached
 
 logger = PixelPouchLoggerFactory.get_logger(__name__)
 
 
 OTHER_CATEGORY_NAME = "Other"
 
+#: Recognized SVG suffixes, compared case-insensitively.
+_SVG_SUFFIXES = frozenset((".svg", ".svgz"))
+
+
+class _BakedCategoryModule(Protocol):
+    """Shape of the generated ``_svg_categories_baked`` module."""
+
+    SOURCE_MTIME_NS: int
+    CATEGORY_MAP: Mapping[str, tuple[str, ...]]
+
+
+def _load_baked_category_map(mtime_ns: int) -> Mapping[str, tuple[str, ...]] | None:
+    """
+    Return the baked category map if it matches the JSON source.
+
+    The baked module is generated by ``bin/bake_svg_categories.py``;
+    importing a compiled module is much cheaper than parsing the JSON.
+    It is loaded through importlib because it only exists in baked
+    deployments and is not part of the source tree.
+
+    Args:
+        mtime_ns: Modification time of the JSON source in nanoseconds.
+
+    Returns:
+        The baked mapping, or None if no bake exists or it is stale.
+    """
+    try:
+        baked = cast(
+            "_BakedCategoryModule",
+            importlib.import_module("pixelpouch.houdini.ops._svg_categories_baked"),
+        )
+    except ImportError:
+        return None
+
+    if baked.SOURCE_MTIME_NS != mtime_ns:
+        logger.debug("Baked SVG category map is stale; falling back to JSON.")
+        return None
+    return baked.CATEGORY_MAP
+
+
+@functools.lru_cache(maxsize=4)
+def _load_category_map_cached(
+    path_str: str,
+    mtime_ns: int,
+) -> tuple[tuple[str, ...], dict[str, str]]:
+    """
+    Parse the category JSON once per (path, mtime) pair.
+
+    The parsed mapping is inverted into a folder -> category index so that
+    regrouping becomes a single pass over the raw folder groups instead of
+    a nested category/folder loop per call.
+
+    Args:
+        path_str: Path to the JSON category definition as a string.
+        mtime_ns: Modification time of the file in nanoseconds (cache key).
+
+    Returns:
+        Tuple of (category order as defined in JSON, folder -> category
+        index).
+    """
+    raw: Mapping[str, list[str]] | Mapping[str, tuple[str, ...]] | None
+    raw = _load_baked_category_map(mtime_ns)
+    if raw is None:
+        raw = json.loads(Path(path_str).read_bytes())
+
+    folder_to_category = {
+        folder: category for category, folders in raw.items() for folder in folders
+    }
+    return tuple(raw), folder_to_category
+
 
 def load_svg_category_map(path: Path) -> dict[str, set[str]]:
     """
@@ -49,34 +119,32 @@ def regroup_svgs_for_ui(
         Ordered dict-like mapping (insertion order preserved):
         category name -> list of SVG paths
     """
-    # SVGs grouped by original folder name (e.g. SOP, DOP, ...)
-    raw_groups = group_svgs_by_folder(zip_path)
-
-    # JSON: category -> [folder names]
-    category_map: Mapping[str, list[str]] = load_json(category_map_path)
-
+    category_order, folder_to_category = _load_category_map_cached(
+        str(category_map_path),
+        category_map_path.stat().st_mtime_ns,
+    )
+
+    # Single streaming pass over the central directory: each entry maps
+    # straight to its category (or "Other") without materializing an
+    # intermediate per-folder grouping.
+    zf = open_zip_cached(str(zip_path))
     ui_groups: dict[str, list[str]] = {}
-    used_folders: set[str] = set()
-
-    # 1. Explicit categories (JSON order is preserved)
-    for category, folders in category_map.items():
-        svg_list: list[str] = []
-
-        for folder in folders:
-            if folder in raw_groups:
-                svg_list.extend(raw_groups[folder])
-                used_folders.add(folder)
-
-        if svg_list:
-            ui_groups[category] = svg_list
-
-    # 2. Everything else -> Other
-    other_svgs: list[str] = []
-    for folder, svg_paths in raw_groups.items():
-        if folder not in used_folders:
-            other_svgs.extend(svg_paths)
-
-    if other_svgs:
-        ui_groups[OTHER_CATEGORY_NAME] = other_svgs
-
-    return ui_groups
+    for name in zf.namelist():
+        if os.path.splitext(name)[1].lower() not in _SVG_SUFFIXES:
+            continue
+
+        idx = name.find("/")
+        folder = name[:idx] if idx > 0 else "root"
+        category = folder_to_category.get(folder, OTHER_CATEGORY_NAME)
+        ui_groups.setdefault(category, []).append(name)
+
+    # Reorder: JSON category order first, "Other" always last
+    ordered = {
+        category: ui_groups[category]
+        for category in category_order
+        if category in ui_groups and category != OTHER_CATEGORY_NAME
+    }
+    if OTHER_CATEGORY_NAME in ui_groups:
+        ordered[OTHER_CATEGORY_NAME] = ui_groups[OTHER_CATEGORY_NAME]
+
+    return ordered
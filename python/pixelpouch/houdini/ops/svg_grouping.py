@@ -5,14 +5,18 @@ archive. SVG paths are grouped by their top-level folder to support structured
 browsing and presentation in UI components.
 """
 
-import zipfile
+import os
 from collections import defaultdict
 from pathlib import Path
 
 from pixelpouch.libs.core.logging_factory import PixelPouchLoggerFactory
+from pixelpouch.libs.core.utility import open_zip_cached
 
 logger = PixelPouchLoggerFactory.get_logger(__name__)
 
+#: Recognized SVG suffixes, compared case-insensitively.
+_SVG_SUFFIXES = frozenset((".svg", ".svgz"))
+
 
 def group_svgs_by_folder(zip_path: Path) -> dict[str, list[str]]:
     """Groups SVG files in a ZIP archive by their top-level folder.
@@ -30,13 +34,18 @@ def group_svgs_by_folder(zip_path: Path) -> dict[str, list[str]]:
     """
     groups: dict[str, list[str]] = defaultdict(list)
 
-    with zipfile.ZipFile(zip_path) as zf:
-        for name in zf.namelist():
-            if not name.lower().endswith(".svg"):
-                continue
+    zf = open_zip_cached(str(zip_path))
+
+    # Single pass over the central directory. Lowercasing only the
+    # suffix and using ``find`` avoid the per-entry full ``lower()`` /
+    # ``split`` string allocations, which dominate for large icon
+    # packs, while keeping the match case-insensitive like svg_loader.
+    for name in zf.namelist():
+        if os.path.splitext(name)[1].lower() not in _SVG_SUFFIXES:
+            continue
 
-            parts = name.split("/")
-            folder = parts[0] if len(parts) > 1 else "root"
-            groups[folder].append(name)
+        idx = name.find("/")
+        folder = name[:idx] if idx > 0 else "root"
+        groups[folder].append(name)
 
     return dict(groups)
@@ -3,14 +3,21 @@
 This module provides helper functions to enumerate SVG files stored in a ZIP
 archive and to load SVG data as QIcon objects. Loaded icons are cached in
 memory to avoid redundant rendering and improve performance when the same
-icons are requested multiple times.
+icons are requested multiple times. Rendered icons are additionally
+persisted as PNG files in the PixelPouch local data directory so that
+subsequent Houdini sessions skip the SVG rendering entirely.
 """
 
-import zipfile
+import functools
+import hashlib
 from pathlib import Path
 from typing import Iterable
 
+from pixelpouch.libs.core.environment_variable_key import (
+    get_pixelpouch_environment_variables,
+)
 from pixelpouch.libs.core.logging_factory import PixelPouchLoggerFactory
+from pixelpouch.libs.core.utility import open_zip_cached
 from PySide6 import QtCore, QtGui
 from PySide6.QtSvg import QSvgRenderer
 
@@ -20,6 +27,76 @@ IconCacheKey = tuple[str, str, int]
 _ICON_CACHE: dict[IconCacheKey, QtGui.QIcon] = {}
 
 
+@functools.lru_cache(maxsize=1)
+def _disk_cache_dir() -> Path:
+    """Returns the directory holding icons persisted across sessions.
+
+    Resolved lazily on the first cache access so importing this module
+    does not require the PixelPouch environment variables to be set.
+
+    Returns:
+        The icon cache directory under the local data directory.
+    """
+    env = get_pixelpouch_environment_variables()
+    return env.PIXELPOUCH_LOCAL_DATA_DIR / "icon_cache"
+
+
+def _disk_cache_path(zip_path: Path, svg_path_in_zip: str, size: int) -> Path:
+    """Returns the on-disk cache location for a rendered icon.
+
+    The file name is a content hash of the ZIP path, its modification time,
+    the SVG path inside the archive, and the icon size, so the cache is
+    invalidated automatically when the icon pack changes.
+
+    Args:
+        zip_path: Path to the ZIP archive containing the SVG file.
+        svg_path_in_zip: Path to the SVG file inside the ZIP archive.
+        size: Width and height of the rendered icon in pixels.
+
+    Returns:
+        Path of the cached PNG file (which may not exist yet).
+    """
+    mtime_ns = zip_path.stat().st_mtime_ns
+    key = f"{zip_path}:{mtime_ns}:{svg_path_in_zip}:{size}"
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+    return _disk_cache_dir() / f"{digest}.png"
+
+
+def _load_cached_pixmap(cache_path: Path) -> QtGui.QPixmap | None:
+    """Loads a previously rendered icon pixmap from the disk cache.
+
+    Args:
+        cache_path: Path of the cached PNG file.
+
+    Returns:
+        The cached pixmap, or ``None`` if the file is missing or unreadable.
+    """
+    if not cache_path.is_file():
+        return None
+
+    pixmap = QtGui.QPixmap(str(cache_path))
+    if pixmap.isNull():
+        return None
+    return pixmap
+
+
+def _store_cached_pixmap(cache_path: Path, pixmap: QtGui.QPixmap) -> None:
+    """Persists a rendered icon pixmap to the disk cache.
+
+    Cache writes are best-effort; failures are logged and never propagate
+    to the caller.
+
+    Args:
+        cache_path: Path of the cached PNG file.
+        pixmap: Rendered icon pixmap to store.
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        pixmap.save(str(cache_path), "PNG")
+    except OSError:
+        logger.exception("Failed to write icon cache file '%s'.", cache_path)
+
+
 def iter_svg_files_in_zip(zip_path: Path) -> Iterable[str]:
     """Iterates over SVG file paths stored in a ZIP archive.
 
@@ -33,10 +110,10 @@ def iter_svg_files_in_zip(zip_path: Path) -> Iterable[str]:
     Yields:
         SVG file paths inside the ZIP archive.
     """
-    with zipfile.ZipFile(zip_path) as zf:
-        for name in sorted(zf.namelist()):
-            if name.lower().endswith(".svg"):
-                yield name
+    zf = open_zip_cached(str(zip_path))
+    for name in sorted(zf.namelist()):
+        if name.lower().endswith(".svg"):
+            yield name
 
 
 def load_svg_icon_from_zip(
@@ -62,8 +139,14 @@ def load_svg_icon_from_zip(
     if key in _ICON_CACHE:
         return _ICON_CACHE[key]
 
-    with zipfile.ZipFile(zip_path) as zf:
-        svg_bytes = zf.read(svg_path_in_zip)
+    cache_path = _disk_cache_path(zip_path, svg_path_in_zip, size)
+    cached_pixmap = _load_cached_pixmap(cache_path)
+    if cached_pixmap is not None:
+        icon = QtGui.QIcon(cached_pixmap)
+        _ICON_CACHE[key] = icon
+        return icon
+
+    svg_bytes = open_zip_cached(str(zip_path)).read(svg_path_in_zip)
 
     renderer = QSvgRenderer(QtCore.QByteArray(svg_bytes))
     if not renderer.isValid():
@@ -81,6 +164,8 @@ def load_svg_icon_from_zip(
     renderer.render(painter)
     painter.end()
 
+    _store_cached_pixmap(cache_path, pixmap)
+
     icon = QtGui.QIcon(pixmap)
     _ICON_CACHE[key] = icon
     return icon
@@ -6,10 +6,20 @@ background color scheme for quick visual switching.
 """
 
 import hou
+from pixelpouch.houdini.ops.panes import resolve_pane
 from pixelpouch.libs.core.logging_factory import PixelPouchLoggerFactory
 
 logger = PixelPouchLoggerFactory.get_logger(__name__)
 
+#: Successor table for the viewport color-scheme cycle. Built once at
+#: import so toggling is a single dict lookup instead of an if/elif chain,
+#: and extending the cycle with new schemes is a one-line change.
+_NEXT_SCHEME: dict[hou.EnumValue, tuple[hou.EnumValue, str]] = {
+    hou.viewportColorScheme.Dark: (hou.viewportColorScheme.Grey, "Grey"),
+    hou.viewportColorScheme.Grey: (hou.viewportColorScheme.Light, "Light"),
+    hou.viewportColorScheme.Light: (hou.viewportColorScheme.Dark, "Dark"),
+}
+
 
 def toggle_viewport_background():
     """Cycles the Scene Viewer viewport background color scheme.
@@ -24,33 +34,20 @@ def toggle_viewport_background():
     Raises:
         hou.Error: If no Scene Viewer can be found in the current UI context.
     """
-    pane = hou.ui.paneTabUnderCursor()
-    used_fallback = False
-    if not pane or pane.type() != hou.paneTabType.SceneViewer:
-        pane = hou.ui.curDesktop().paneTabOfType(hou.paneTabType.SceneViewer)
+    pane = resolve_pane(hou.paneTabType.SceneViewer)
 
     if not pane:
         logger.error("No Scene Viewer found.")
         hou.ui.displayMessage("No Scene Viewer found.")
         raise hou.Error("No Scene Viewer found.")
 
-    if used_fallback:
-        logger.debug(
-            "Scene Viewer not under cursor; using first available Scene Viewer."
-        )
-
     viewport: hou.SceneViewer = pane.curViewport()
     settings: hou.GeometryViewportSettings = viewport.settings()
     color_scheme: hou.EnumValue = settings.colorScheme()
 
-    if color_scheme == hou.viewportColorScheme.Dark:
-        settings.setColorScheme(hou.viewportColorScheme.Grey)
-        new_scheme = "Grey"
-    elif color_scheme == hou.viewportColorScheme.Grey:
-        settings.setColorScheme(hou.viewportColorScheme.Light)
-        new_scheme = "Light"
-    else:
-        settings.setColorScheme(hou.viewportColorScheme.Dark)
-        new_scheme = "Dark"
+    next_scheme, new_scheme = _NEXT_SCHEME.get(
+        color_scheme, (hou.viewportColorScheme.Dark, "Dark")
+    )
+    settings.setColorScheme(next_scheme)
 
     logger.info("Viewport background color scheme set to %s.", new_scheme)
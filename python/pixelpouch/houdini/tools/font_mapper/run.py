@@ -7,10 +7,10 @@ from pixelpouch.houdini.tools.font_mapper.views.font_mapper_window import (
 )
 from pixelpouch.libs.core.environment_variable_key import (
     ExecutionContextEnv,
-    PixelPouchEnvironmentVariables,
+    get_pixelpouch_environment_variables,
 )
 from pixelpouch.libs.core.houdini.hou_environment_variables import (
-    HoudiniEnvironmentVariables,
+    get_houdini_environment_variables,
 )
 from pixelpouch.libs.core.logging_factory import PixelPouchLoggerFactory
 from pixelpouch.libs.core.qt.application import get_qapplication
@@ -18,12 +18,12 @@ from PySide6 import QtCore, QtWidgets
 
 logger = PixelPouchLoggerFactory.get_logger(__name__)
 
-HOU_ENV = HoudiniEnvironmentVariables()
+HOU_ENV = get_houdini_environment_variables()
 _HOUDINI_FONTS_DIR = HOU_ENV.HOUDINI_USER_PREF_DIR / "fonts"
 
 
 def run(parent: Optional[QtWidgets.QMainWindow] = None) -> None:
-    PP_ENV = PixelPouchEnvironmentVariables()
+    PP_ENV = get_pixelpouch_environment_variables()
 
     is_vscode = PP_ENV.PIXELPOUCH_EXECUTION_CONTEXT == ExecutionContextEnv.VSCODE
 
@@ -2,7 +2,9 @@ from pathlib import Path
 from typing import Optional
 
 from pixelpouch.houdini.tools.font_mapper.views.ui_font_assigne_widget import Ui_Form
-from pixelpouch.libs.core.environment_variable_key import PixelPouchEnvironmentVariables
+from pixelpouch.libs.core.environment_variable_key import (
+    get_pixelpouch_environment_variables,
+)
 from pixelpouch.libs.core.logging_factory import (
     PixelPouchLoggerFactory,
 )
@@ -10,7 +12,7 @@ from PySide6 import QtGui, QtWidgets
 
 logger = PixelPouchLoggerFactory.get_logger(__name__)
 
-PP_ENV = PixelPouchEnvironmentVariables()
+PP_ENV = get_pixelpouch_environment_variables()
 _HOUDINI_FONTS_DIR = PP_ENV.PIXELPOUCH_LOCATION / "houdini" / "fonts"
 _fonts_loaded = False
 
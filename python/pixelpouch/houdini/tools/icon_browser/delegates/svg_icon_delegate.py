@@ -27,18 +27,71 @@ class SvgIconDelegate(QtWidgets.QStyledItemDelegate):
     ICON_PADDING = 4
     TEXT_HEIGHT = 20
 
+    # Precomputed once at class definition; paint runs per visible cell
+    # per repaint, so even enum/attribute lookups add up.
+    _ICON_PADDING_2 = ICON_PADDING * 2
+    _SELECTED = QtWidgets.QStyle.StateFlag.State_Selected
+    _ICON_ALIGN = QtCore.Qt.AlignmentFlag.AlignCenter
+    _TEXT_FLAGS = (
+        QtCore.Qt.AlignmentFlag.AlignCenter | QtCore.Qt.TextFlag.TextSingleLine
+    )
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        """Initializes the delegate.
+
+        Args:
+            parent: Optional Qt parent object.
+        """
+        super().__init__(parent)
+        self._proxy: SvgFilterProxyModel | None = None
+        self._source: SvgZipListModel | None = None
+
+    def _resolve_models(
+        self,
+        index: QtCore.QModelIndex | QtCore.QPersistentModelIndex,
+    ) -> bool:
+        """Resolves and caches the proxy and source models for an index.
+
+        ``paint`` runs for every visible cell on every repaint, so the
+        two ``isinstance`` checks are performed only when the model behind
+        the view changes, and cached references are reused afterwards.
+
+        Args:
+            index: Model index whose models should be resolved.
+
+        Returns:
+            True if the cached proxy and source models are valid for the
+            given index, otherwise False.
+        """
+        model = index.model()
+        if model is self._proxy and self._source is not None:
+            return True
+
+        if not isinstance(model, SvgFilterProxyModel):
+            logger.debug("Unexpected model type in SvgIconDelegate")
+            return False
+
+        source = model.sourceModel()
+        if not isinstance(source, SvgZipListModel):
+            logger.debug("Unexpected source model type in SvgIconDelegate")
+            return False
+
+        self._proxy = model
+        self._source = source
+        return True
+
     def paint(
         self,
         painter: QtGui.QPainter,
         option: QtWidgets.QStyleOptionViewItem,
         index: QtCore.QModelIndex | QtCore.QPersistentModelIndex,
     ) -> None:
-        """Paints an SVG icon item.
+        """Paints an SVG icon item in a single fused pass.
 
-        This method retrieves the underlying source model index, requests
-        icon generation if necessary, and renders the icon and label. The
-        selection state is respected when drawing background and text
-        colors.
+        Background, icon, and label are drawn in one function with all
+        sub-rects computed up front. Only the pen is mutated (and put
+        back), so no painter save/restore stack pushes occur per cell.
+        Sub-rects outside the exposed clip are skipped entirely.
 
         Args:
             painter: QPainter used for rendering.
@@ -49,123 +102,60 @@ class SvgIconDelegate(QtWidgets.QStyledItemDelegate):
         if not index.isValid():
             return
 
-        proxy = index.model()
-        if not isinstance(proxy, SvgFilterProxyModel):
-            logger.debug("Unexpected model type in SvgIconDelegate.paint")
-            return
-
-        source = proxy.sourceModel()
-        if not isinstance(source, SvgZipListModel):
-            logger.debug("Unexpected source model type in SvgIconDelegate.paint")
+        # During partial repaints (scrolling, overlapping windows) the
+        # painter clip covers only the exposed region; cells fully outside
+        # it need no work at all, and partially clipped cells can skip
+        # their icon or label.
+        clip: QtCore.QRect | None = None
+        if painter.hasClipping():
+            clip = painter.clipBoundingRect().toAlignedRect()
+            if not clip.intersects(option.rect):
+                return
+
+        if not self._resolve_models(index):
             return
 
-        source_index = proxy.mapToSource(index)
-        row = source_index.row()
-
-        painter.save()
+        assert self._proxy is not None and self._source is not None
+        source = self._source
+        row = self._proxy.mapToSource(index).row()
 
         rect = option.rect
+        selected = bool(option.state & self._SELECTED)
 
-        self._paint_background(painter, option, rect)
-        self._paint_icon(painter, source, row, rect)
-        self._paint_text(painter, option, source_index, rect)
-
-        painter.restore()
-
-    def _paint_background(
-        self,
-        painter: QtGui.QPainter,
-        option: QtWidgets.QStyleOptionViewItem,
-        rect: QtCore.QRect,
-    ) -> None:
-        """Paints the background of an item based on its selection state.
-
-        If the item is selected, this method fills the given rectangle using
-        the highlight color from the style option's palette.
-
-        Args:
-            painter: Painter used to draw the item.
-            option: Style options describing the item's state and appearance.
-            rect: Rectangle area representing the item's bounds.
-        """
-        if option.state & QtWidgets.QStyle.StateFlag.State_Selected:
+        if selected:
             painter.fillRect(rect, option.palette.highlight())
 
-    def _paint_icon(
-        self,
-        painter: QtGui.QPainter,
-        source_model: SvgZipListModel,
-        row: int,
-        rect: QtCore.QRect,
-    ) -> None:
-        """Paints the icon for the specified row within the given rectangle.
-
-        This method calculates the icon drawing area with padding applied.
-        If the icon is not yet available, it requests asynchronous loading
-        from the source model and returns without drawing.
-
-        Args:
-            painter: Painter used to draw the icon.
-            source_model: Source model providing icon data.
-            row: Row index of the item whose icon is being painted.
-            rect: Rectangle area representing the item's bounds.
-        """
         icon_rect = QtCore.QRect(
             rect.x() + self.ICON_PADDING,
             rect.y() + self.ICON_PADDING,
-            rect.width() - self.ICON_PADDING * 2,
-            rect.height() - self.TEXT_HEIGHT - self.ICON_PADDING * 2,
-        )
-
-        icon = source_model.get_icon(row)
-        if icon is None:
-            source_model.request_icon(row)
-            return
-
-        icon.paint(
-            painter,
-            icon_rect,
-            QtCore.Qt.AlignmentFlag.AlignCenter,
+            rect.width() - self._ICON_PADDING_2,
+            rect.height() - self.TEXT_HEIGHT - self._ICON_PADDING_2,
         )
+        if clip is None or clip.intersects(icon_rect):
+            icon = source.get_icon(row)
+            if icon is None:
+                source.request_icon(row)
+            else:
+                icon.paint(painter, icon_rect, self._ICON_ALIGN)
 
-    def _paint_text(
-        self,
-        painter: QtGui.QPainter,
-        option: QtWidgets.QStyleOptionViewItem,
-        source_index: QtCore.QModelIndex,
-        rect: QtCore.QRect,
-    ) -> None:
-        """Paints the display text for an item below its icon.
-
-        The text color is determined by the selection state of the item.
-        The text is drawn centered within the text area and rendered as a
-        single line.
-
-        Args:
-            painter: Painter used to draw the text.
-            option: Style options describing the item's state and appearance.
-            source_index: Source model index providing the display text.
-            rect: Rectangle area representing the item's bounds.
-        """
         text_rect = QtCore.QRect(
             rect.x(),
             rect.bottom() - self.TEXT_HEIGHT,
             rect.width(),
             self.TEXT_HEIGHT,
         )
+        if clip is not None and not clip.intersects(text_rect):
+            return
 
         text_color = (
             option.palette.highlightedText().color()
-            if option.state & QtWidgets.QStyle.StateFlag.State_Selected
+            if selected
             else option.palette.text().color()
         )
+        prev_pen = painter.pen()
         painter.setPen(text_color)
-
-        painter.drawText(
-            text_rect,
-            QtCore.Qt.AlignmentFlag.AlignCenter | QtCore.Qt.TextFlag.TextSingleLine,
-            source_index.data(QtCore.Qt.ItemDataRole.DisplayRole),
-        )
+        painter.drawText(text_rect, self._TEXT_FLAGS, source.display_name(row))
+        painter.setPen(prev_pen)
 
     def sizeHint(
         self,
@@ -207,13 +197,11 @@ class SvgIconDelegate(QtWidgets.QStyledItemDelegate):
         if not index.isValid():
             return False
 
-        proxy = index.model()
-        if not isinstance(proxy, SvgFilterProxyModel):
-            logger.debug("Unexpected model type in SvgIconDelegate.helpEvent")
+        if not self._resolve_models(index):
             return False
 
-        proxy_model: SvgFilterProxyModel = proxy
-        source_index: QtCore.QModelIndex = proxy_model.mapToSource(index)
+        assert self._proxy is not None
+        source_index: QtCore.QModelIndex = self._proxy.mapToSource(index)
 
         text = source_index.data()
         if not text:
@@ -2,22 +2,30 @@
 
 This module provides a QAbstractListModel implementation that represents
 SVG file paths stored inside a ZIP archive. Icons are generated lazily and
-asynchronously using a worker and a global QThreadPool to avoid blocking
-the UI thread.
+asynchronously using batch workers on a dedicated render QThreadPool to
+avoid blocking the UI thread.
 """
 
+import hashlib
+import os
+import shutil
+import threading
+import zipfile
 from pathlib import Path, PurePosixPath
 from types import ModuleType
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterable, Optional
 
 from pixelpouch.libs.core.environment_variable_key import (
     ExecutionContextEnv,
-    PixelPouchEnvironmentVariables,
+    get_pixelpouch_environment_variables,
 )
 from pixelpouch.libs.core.logging_factory import PixelPouchLoggerFactory
-from pixelpouch.libs.worker.svg_icon_worker import SvgIconWorker
+from pixelpouch.libs.worker.svg_icon_worker import (
+    SvgIconBatchWorker,
+    get_icon_render_pool,
+    release_image,
+)
 from PySide6 import QtCore, QtGui
-from PySide6.QtCore import QThreadPool
 
 if TYPE_CHECKING:
     from types import ModuleType
@@ -25,7 +33,7 @@ if TYPE_CHECKING:
 
 logger = PixelPouchLoggerFactory.get_logger(__name__)
 
-PP_ENV = PixelPouchEnvironmentVariables()
+PP_ENV = get_pixelpouch_environment_variables()
 
 
 class SvgZipListModel(QtCore.QAbstractListModel):
@@ -36,11 +44,23 @@ class SvgZipListModel(QtCore.QAbstractListModel):
     loaded.
     """
 
+    # Rows dispatched per background worker. Batching amortizes the zip
+    # open and the finished-signal round trip across a scroll burst.
+    _BATCH_SIZE = 16
+
+    # Per-row icon states kept in a bytearray: one C-level index per
+    # check instead of set/dict hashing on the paint-driven hot path.
+    _EMPTY = 0
+    _LOADING = 1
+    _READY = 2
+
     def __init__(
         self,
         zip_path: Path,
         svg_paths: list[str],
         icon_size: int = 32,
+        device_pixel_ratio: float = 1.0,
+        zip_file: zipfile.ZipFile | None = None,
         parent: QtCore.QObject | None = None,
     ) -> None:
         """Initializes the SVG ZIP list model.
@@ -48,18 +68,95 @@ class SvgZipListModel(QtCore.QAbstractListModel):
         Args:
             zip_path: Path to the ZIP archive containing SVG files.
             svg_paths: List of SVG file paths inside the ZIP archive.
-            icon_size: Size of the generated icons in pixels.
+            icon_size: Size of the generated icons in device pixels.
+            device_pixel_ratio: Ratio of device pixels to logical pixels
+                on the target screen. Rendering at the physical size and
+                tagging the pixmap with the ratio avoids a rescale on
+                every paint on HiDPI displays.
+            zip_file: Optional already-open handle on ``zip_path``, e.g.
+                shared by all tabs of a browser window so the central
+                directory is parsed once per archive instead of per tab.
             parent: Optional Qt parent object.
         """
         super().__init__(parent)
         self._zip_path = zip_path
+        # The icon archive is read-only, so one long-lived handle (and one
+        # central-directory parse) serves every batch worker for the
+        # lifetime of the model. Reads on the shared handle are serialized
+        # by a lock.
+        self._zip_file = (
+            zip_file if zip_file is not None else zipfile.ZipFile(zip_path, "r")
+        )
+        self._zip_lock = threading.Lock()
         self._svg_paths = svg_paths
+        # ZipInfo per row, resolved once from the central directory;
+        # workers read by info and skip the name-to-info lookup per
+        # member, and batch ordering reuses the cached header offsets.
+        getinfo = self._zip_file.getinfo
+        self._zip_infos = [getinfo(path) for path in svg_paths]
+        # Lowercased parallel array so filtering does not re-lower every
+        # path on every keystroke.
+        self._svg_paths_lower = [path.lower() for path in svg_paths]
+        # Short labels painted under the icons, precomputed so the
+        # delegate's text path skips the data()/QVariant round trip.
+        self._display_names = [
+            PurePosixPath(path).stem for path in svg_paths
+        ]
         self._icon_size = icon_size
-
-        self._icons: dict[int, QtGui.QIcon] = {}
-        self._loading: set[int] = set()
-
-        self._thread_pool = QThreadPool.globalInstance()
+        self._device_pixel_ratio = device_pixel_ratio
+
+        self._state = bytearray(len(svg_paths))
+        # Rows whose Houdini icon lookup already failed; OperationFailed
+        # is raised per miss and the result never changes for a row, so
+        # each name is probed at most once.
+        self._hou_missing = bytearray(len(svg_paths))
+
+        # Zip-icon requests are coalesced per event-loop turn, then
+        # dispatched in batches from _flush_requests. Rows handed to a
+        # worker sit in _inflight until their batch reports back;
+        # _cancelled (shared with workers, hence the lock) marks inflight
+        # rows whose render should be skipped.
+        self._pending: set[int] = set()
+        self._flush_scheduled = False
+        self._inflight: set[int] = set()
+        self._viewport_center = 0
+        self._cancelled: set[int] = set()
+        self._cancel_lock = threading.Lock()
+
+        self._thread_pool = get_icon_render_pool()
+
+        # Rendered icons are persisted as PNGs so warm starts skip the SVG
+        # parse + rasterization. The directory is keyed by the archive
+        # mtime and icon size, so a changed icon pack invalidates itself.
+        self._disk_cache_dir: Path | None
+        try:
+            zip_mtime_ns = zip_path.stat().st_mtime_ns
+            self._disk_cache_dir = (
+                PP_ENV.PIXELPOUCH_LOCAL_DATA_DIR
+                / "icon_cache"
+                / f"{zip_mtime_ns}_{icon_size}"
+            )
+        except OSError:
+            logger.exception("Failed to stat zip '%s'; icon disk cache off.", zip_path)
+            zip_mtime_ns = 0
+            self._disk_cache_dir = None
+
+        if self._disk_cache_dir is not None:
+            self._prune_stale_cache_dirs(zip_mtime_ns)
+
+        # Rendered pixmaps live in the application-wide QPixmapCache, which
+        # caps memory and evicts least-recently-used entries, instead of an
+        # unbounded per-model dict of QIcons. Keys are path digests (not
+        # row indices), so every model over the same archive and size —
+        # e.g. the tabs of one browser window — shares rendered entries.
+        prefix = f"svgicon:{zip_mtime_ns}:{icon_size}:"
+        self._path_digests = [
+            hashlib.blake2b(path.encode("utf-8"), digest_size=8).hexdigest()
+            for path in svg_paths
+        ]
+        self._pixmap_keys = [
+            prefix + digest for digest in self._path_digests
+        ]
 
         # --------------------------------------------------
         # Execution context detection (PixelPouch standard)
@@ -69,8 +166,35 @@ class SvgZipListModel(QtCore.QAbstractListModel):
             import hou
 
             self._hou = hou
+            # Icon names never change for a given path, so the
+            # PurePosixPath parsing is done once up front instead of per
+            # request.
+            self._hou_names = [
+                self._make_houdini_icon_name(path) for path in svg_paths
+            ]
         else:
             self._hou = None
+            self._hou_names = []
+
+    @staticmethod
+    def _prune_stale_cache_dirs(zip_mtime_ns: int) -> None:
+        """Removes icon-cache generations for older archive versions.
+
+        Cache directories are keyed by archive mtime; when the icon pack
+        is updated, the previous generations would otherwise accumulate
+        unbounded. Removal is best-effort.
+
+        Args:
+            zip_mtime_ns: Modification time of the current archive.
+        """
+        cache_root = PP_ENV.PIXELPOUCH_LOCAL_DATA_DIR / "icon_cache"
+        prefix = f"{zip_mtime_ns}_"
+        try:
+            for entry in os.scandir(cache_root):
+                if entry.is_dir() and not entry.name.startswith(prefix):
+                    shutil.rmtree(entry.path, ignore_errors=True)
+        except OSError:
+            logger.debug("Could not prune icon cache under %s.", cache_root)
 
     def rowCount(
         self,
@@ -110,6 +234,61 @@ class SvgZipListModel(QtCore.QAbstractListModel):
 
         return None
 
+    def svg_path_lower(self, row: int) -> str:
+        """Returns the lowercased SVG path for a row.
+
+        Used by the filter proxy on its hot path to avoid a
+        ``data()``/``lower()`` round trip per row per keystroke.
+
+        Args:
+            row: Row index of the SVG entry.
+
+        Returns:
+            The lowercased SVG path string.
+        """
+        return self._svg_paths_lower[row]
+
+    def display_name(self, row: int) -> str:
+        """Returns the short display label for a row.
+
+        Used by the delegate on its paint path to avoid going through the
+        Qt model layer per visible cell per repaint.
+
+        Args:
+            row: Row index of the SVG entry.
+
+        Returns:
+            The file stem of the SVG path.
+        """
+        return self._display_names[row]
+
+    def _pixmap_key(self, row: int) -> str:
+        """Returns the QPixmapCache key for a row.
+
+        Args:
+            row: Row index of the SVG entry.
+
+        Returns:
+            A stable cache key string for the row's rendered pixmap.
+        """
+        return self._pixmap_keys[row]
+
+    def _store_pixmap(self, row: int, pixmap: QtGui.QPixmap) -> None:
+        """Stores a rendered pixmap in the application pixmap cache and
+        notifies views that the row changed.
+
+        Args:
+            row: Row index of the SVG entry.
+            pixmap: Rendered icon pixmap.
+        """
+        if self._device_pixel_ratio != 1.0:
+            pixmap.setDevicePixelRatio(self._device_pixel_ratio)
+        QtGui.QPixmapCache.insert(self._pixmap_key(row), pixmap)
+        self._state[row] = self._READY
+
+        idx = self.index(row)
+        self.dataChanged.emit(idx, idx)
+
     def get_icon(self, row: int) -> QtGui.QIcon | None:
         """Returns the cached icon for a given row, if available.
 
@@ -119,7 +298,22 @@ class SvgZipListModel(QtCore.QAbstractListModel):
         Returns:
             The corresponding QIcon if loaded, otherwise None.
         """
-        return self._icons.get(row)
+        pixmap = QtGui.QPixmap()
+        if not QtGui.QPixmapCache.find(self._pixmap_key(row), pixmap):
+            return None
+        return QtGui.QIcon(pixmap)
+
+    def prewarm(self, rows: Iterable[int]) -> None:
+        """Requests icon generation for rows ahead of the scroll viewport.
+
+        Rows whose icons are already cached or in flight are skipped, so
+        prewarming is cheap when the cache is warm.
+
+        Args:
+            rows: Row indices to prewarm.
+        """
+        for row in rows:
+            self.request_icon(row)
 
     def request_icon(self, row: int) -> None:
         """Requests asynchronous icon generation for the specified row.
@@ -132,14 +326,23 @@ class SvgZipListModel(QtCore.QAbstractListModel):
         Args:
             row: Index of the row corresponding to the SVG entry.
         """
-        if row in self._icons or row in self._loading:
+        state = self._state[row]
+        if state == self._LOADING:
             return
+        if state == self._READY:
+            # The pixmap cache may have evicted the entry; only then is a
+            # re-render needed.
+            if QtGui.QPixmapCache.find(self._pixmap_key(row), QtGui.QPixmap()):
+                return
 
-        self._loading.add(row)
+        self._state[row] = self._LOADING
 
         if self._try_houdini_icon(row):
             return
 
+        if self._try_disk_cache(row):
+            return
+
         self._request_zip_icon(row)
 
     def _try_houdini_icon(self, row: int) -> bool:
@@ -155,72 +358,205 @@ class SvgZipListModel(QtCore.QAbstractListModel):
         Returns:
             True if the icon was successfully loaded from Houdini; otherwise False.
         """
-        if self._hou is None:
+        if self._hou is None or self._hou_missing[row]:
             return False
 
-        name = self._make_houdini_icon_name(row)
+        name = self._hou_names[row]
 
         try:
             icon = self._hou.qt.Icon(name)
         except self._hou.OperationFailed:
             logger.debug("Houdini icon not found: %s", name)
+            self._hou_missing[row] = 1
             return False
 
-        self._icons[row] = icon
-        self._loading.discard(row)
+        self._store_pixmap(
+            row, icon.pixmap(self._icon_size, self._icon_size)
+        )
+        return True
 
-        idx = self.index(row)
-        self.dataChanged.emit(idx, idx)
+    def _disk_cache_file(self, row: int) -> Path:
+        """Returns the on-disk cache location for a row's rendered icon.
+
+        Args:
+            row: Index of the row corresponding to the SVG entry.
+
+        Returns:
+            Path of the cached PNG file (which may not exist yet).
+        """
+        assert self._disk_cache_dir is not None
+        return self._disk_cache_dir / f"{self._path_digests[row]}.png"
+
+    def _try_disk_cache(self, row: int) -> bool:
+        """Attempts to load a previously rendered icon from the disk cache.
+
+        Loading a small PNG is fast enough to do synchronously on the UI
+        thread and skips the SVG parse and rasterization entirely.
+
+        Args:
+            row: Index of the row corresponding to the SVG entry.
+
+        Returns:
+            True if a cached icon was loaded; otherwise False.
+        """
+        if self._disk_cache_dir is None:
+            return False
+
+        cache_file = self._disk_cache_file(row)
+        if not cache_file.is_file():
+            return False
+
+        pixmap = QtGui.QPixmap(str(cache_file))
+        if pixmap.isNull():
+            return False
+
+        self._store_pixmap(row, pixmap)
         return True
 
+    def _store_disk_cache(self, row: int, image: QtGui.QImage) -> None:
+        """Persists a rendered icon image to the disk cache (best-effort).
+
+        Args:
+            row: Row index of the rendered icon.
+            image: Rendered icon image.
+        """
+        if self._disk_cache_dir is None:
+            return
+
+        try:
+            self._disk_cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so a crash mid-save never leaves a
+            # truncated PNG that later loads as a corrupt icon. The temp
+            # name keeps the .png suffix so Qt infers the format; the
+            # explicit format argument has incompatible stub and runtime
+            # types on current PySide builds.
+            cache_file = self._disk_cache_file(row)
+            tmp_file = cache_file.with_suffix(".tmp.png")
+            if image.save(str(tmp_file)):
+                os.replace(tmp_file, cache_file)
+        except OSError:
+            logger.exception("Failed to write icon cache for row %d.", row)
+
     def _request_zip_icon(self, row: int) -> None:
-        """Requests icon generation from an SVG file inside a zip archive.
+        """Queues icon generation from an SVG file inside a zip archive.
 
-        This method creates a worker responsible for loading and rendering
-        the SVG icon asynchronously, connects its completion signal, and
-        schedules it on the thread pool.
+        Rather than starting one worker per row, requests are collected
+        into a pending set and flushed once per event-loop turn, so a
+        scroll burst produces a handful of batch workers instead of one
+        runnable (and one signal) per visible row.
 
         Args:
             row: Index of the row corresponding to the SVG entry.
         """
-        worker = SvgIconWorker(
-            row=row,
-            zip_path=self._zip_path,
-            svg_path_in_zip=self._svg_paths[row],
-            size=self._icon_size,
-        )
-        worker.signals.finished.connect(self._on_icon_ready)
-        self._thread_pool.start(worker)
+        self._pending.add(row)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QtCore.QTimer.singleShot(0, self._flush_requests)
+
+    def set_viewport_center(self, row: int) -> None:
+        """Records the source row at the center of the visible viewport.
+
+        Pending requests are dispatched closest-to-center first, so the
+        rows under the user's gaze render before lookahead rows.
+
+        Args:
+            row: Source row index at the viewport center.
+        """
+        self._viewport_center = row
 
-    def _make_houdini_icon_name(self, row: int) -> str:
-        """Constructs a Houdini icon name from the SVG path at the given row.
+    def _flush_requests(self) -> None:
+        """Dispatches all pending zip-icon requests in fixed-size batches.
+
+        Rows are ordered by distance from the viewport center and each
+        batch is started with a descending thread-pool priority, so
+        center batches jump the queue even when many are pending.
+        """
+        self._flush_scheduled = False
+        center = self._viewport_center
+        pending = sorted(self._pending, key=lambda row: abs(row - center))
+        self._pending.clear()
+
+        self._inflight.update(pending)
+        infos = self._zip_infos
+        for batch_ordinal, start in enumerate(
+            range(0, len(pending), self._BATCH_SIZE)
+        ):
+            rows = pending[start : start + self._BATCH_SIZE]
+            # Within a batch, read members in file order so the buffered
+            # archive reads run sequentially instead of seeking around.
+            rows.sort(key=lambda row: infos[row].header_offset)
+            worker = SvgIconBatchWorker(
+                rows=rows,
+                zip_file=self._zip_file,
+                zip_lock=self._zip_lock,
+                members=[infos[row] for row in rows],
+                size=self._icon_size,
+                cancelled=self._cancelled,
+                cancel_lock=self._cancel_lock,
+            )
+            worker.signals.finished.connect(self._on_batch_ready)
+            self._thread_pool.start(worker, -batch_ordinal)
+
+    def cancel_requests_except(self, keep: set[int]) -> None:
+        """Cancels queued or in-flight icon requests outside a row set.
+
+        After a fast scroll, rows far off-screen would otherwise hold
+        thread-pool slots ahead of the rows the user is actually looking
+        at. Not-yet-dispatched rows are dropped from the pending set;
+        rows already handed to a worker are flagged so the worker skips
+        rendering them.
+
+        Args:
+            keep: Source rows whose requests should stay alive.
+        """
+        for row in self._pending - keep:
+            self._pending.discard(row)
+            self._state[row] = self._EMPTY
+
+        stale = self._inflight - keep
+        if stale:
+            with self._cancel_lock:
+                self._cancelled |= stale
+
+    @staticmethod
+    def _make_houdini_icon_name(svg_path: str) -> str:
+        """Constructs a Houdini icon name from an SVG path.
 
         The icon name is generated by combining the parent directory name
         and the file stem of the SVG path.
 
         Args:
-            row: Index of the row corresponding to the SVG entry.
+            svg_path: SVG file path inside the ZIP archive.
 
         Returns:
             A string representing the Houdini icon name.
         """
-        path = PurePosixPath(self._svg_paths[row])
+        path = PurePosixPath(svg_path)
         return f"{path.parent.name}_{path.stem}"
 
-    @QtCore.Slot(int, QtGui.QImage)
-    def _on_icon_ready(self, row: int, image: QtGui.QImage) -> None:
-        """Handles completion of asynchronous icon generation.
+    @QtCore.Slot(list)
+    def _on_batch_ready(
+        self, results: list[tuple[int, QtGui.QImage | None]]
+    ) -> None:
+        """Handles completion of a batch of asynchronous icon renders.
 
-        This slot converts the generated image to a QIcon, stores it in the
-        cache, and emits the appropriate dataChanged signal.
+        Each rendered result is converted to a pixmap, stored in the
+        caches, and the corresponding row change is emitted. Cancelled
+        rows (image is None) are reset so a later request can re-render
+        them.
 
         Args:
-            row: Row index of the generated icon.
-            image: Generated icon image.
+            results: List of (row, image) tuples from the batch worker.
         """
-        pixmap = QtGui.QPixmap.fromImage(image)
-        self._icons[row] = QtGui.QIcon(pixmap)
-        self._loading.discard(row)
-
-        idx = self.index(row)
-        self.dataChanged.emit(idx, idx)
+        for row, image in results:
+            self._inflight.discard(row)
+            if image is None:
+                self._state[row] = self._EMPTY
+                with self._cancel_lock:
+                    self._cancelled.discard(row)
+                continue
+            self._store_disk_cache(row, image)
+            self._store_pixmap(row, QtGui.QPixmap.fromImage(image))
+            # Both stores copied the pixels; hand the render buffer back
+            # so the next batch reuses it instead of allocating.
+            release_image(image)
@@ -6,6 +6,11 @@ to the first column and matches rows whose display text satisfies the
 current regular expression.
 """
 
+import re
+
+from pixelpouch.houdini.tools.icon_browser.models.svg_browser_model import (
+    SvgZipListModel,
+)
 from pixelpouch.libs.core.logging_factory import PixelPouchLoggerFactory
 from PySide6 import QtCore
 
@@ -15,8 +20,10 @@ logger = PixelPouchLoggerFactory.get_logger(__name__)
 class SvgFilterProxyModel(QtCore.QSortFilterProxyModel):
     """Proxy model that filters SVG entries by name.
 
-    This proxy model performs case-insensitive filtering based on a regular
-    expression applied to the display data of the first column.
+    This proxy model performs case-insensitive substring filtering. When the
+    source model is an SvgZipListModel, matching runs against its
+    precomputed lowercased path array, avoiding a ``data()``/``lower()``
+    round trip per row per keystroke.
     """
 
     def __init__(self, parent: QtCore.QObject | None = None) -> None:
@@ -28,6 +35,54 @@ class SvgFilterProxyModel(QtCore.QSortFilterProxyModel):
         super().__init__(parent)
         self.setFilterCaseSensitivity(QtCore.Qt.CaseSensitivity.CaseInsensitive)
         self.setFilterKeyColumn(0)
+        self._needle = ""
+        self._regex: re.Pattern[str] | None = None
+        # Rows accepted by the current plain-text filter, and the subset
+        # of rows worth testing for a narrowing keystroke. Appending to a
+        # search term can only shrink the result set, so only previously
+        # accepted rows need re-testing.
+        self._accepted: set[int] | None = None
+        self._candidates: set[int] | None = None
+
+    def setFilterText(self, text: str) -> None:
+        """Sets the search text and re-filters the model.
+
+        Plain text (the common case) is matched with a cheap substring
+        test. Only when the text contains regex metacharacters is it
+        compiled once and matched as a regular expression; an invalid
+        pattern falls back to substring matching. When the new text
+        extends the previous plain-text needle, filtering is restricted
+        to the rows the previous pass accepted.
+
+        Args:
+            text: Search text matched case-insensitively.
+        """
+        prev_needle = self._needle
+        prev_was_plain = self._regex is None
+        prev_accepted = self._accepted
+
+        self._needle = text.lower()
+        self._regex = None
+        if text and text != re.escape(text):
+            try:
+                self._regex = re.compile(text, re.IGNORECASE)
+            except re.error:
+                logger.debug("Invalid filter regex %r; matching literally.", text)
+
+        if (
+            self._regex is None
+            and self._needle
+            and prev_was_plain
+            and prev_needle
+            and prev_accepted is not None
+            and self._needle.startswith(prev_needle)
+        ):
+            self._candidates = prev_accepted
+        else:
+            self._candidates = None
+
+        self._accepted = set() if self._regex is None and self._needle else None
+        self.invalidateFilter()
 
     def filterAcceptsRow(
         self,
@@ -36,8 +91,8 @@ class SvgFilterProxyModel(QtCore.QSortFilterProxyModel):
     ) -> bool:
         """Determines whether a source row should be included.
 
-        A row is accepted if no filter pattern is set, or if the display
-        text of the row matches the current filter regular expression.
+        A row is accepted if no search text is set, or if the lowercased
+        display text of the row contains the search text.
 
         Args:
             source_row: Row index in the source model.
@@ -47,8 +102,26 @@ class SvgFilterProxyModel(QtCore.QSortFilterProxyModel):
             True if the row should be included in the filtered model,
             otherwise False.
         """
-        index = self.sourceModel().index(source_row, 0, source_parent)
-        name = index.data()
-        if not self.filterRegularExpression().pattern():
+        if not self._needle:
             return True
-        return self.filterRegularExpression().match(name).hasMatch()
+
+        if self._candidates is not None and source_row not in self._candidates:
+            return False
+
+        source = self.sourceModel()
+        if isinstance(source, SvgZipListModel):
+            name = source.svg_path_lower(source_row)
+        else:
+            index = source.index(source_row, 0, source_parent)
+            data = index.data()
+            if not data:
+                return False
+            name = data.lower()
+
+        if self._regex is not None:
+            return self._regex.search(name) is not None
+
+        accepted = self._needle in name
+        if accepted and self._accepted is not None:
+            self._accepted.add(source_row)
+        return accepted
@@ -8,18 +8,19 @@ from pixelpouch.houdini.tools.icon_browser.views.svg_browser_window import (
 )
 from pixelpouch.libs.core.environment_variable_key import (
     ExecutionContextEnv,
-    PixelPouchEnvironmentVariables,
+    get_pixelpouch_environment_variables,
 )
-from pixelpouch.libs.core.houdini import HoudiniEnvironmentVariables
+from pixelpouch.libs.core.houdini import get_houdini_environment_variables
 from pixelpouch.libs.core.logging_factory import PixelPouchLoggerFactory
 from pixelpouch.libs.core.qt.application import get_qapplication
+from PySide6 import QtGui
 
 logger = PixelPouchLoggerFactory.get_logger(__name__)
 
 
 def run() -> None:
-    HOU_ENV = HoudiniEnvironmentVariables()
-    PP_ENV = PixelPouchEnvironmentVariables()
+    HOU_ENV = get_houdini_environment_variables()
+    PP_ENV = get_pixelpouch_environment_variables()
 
     zip_path = HOU_ENV.HOUDINI_LOCATION / "houdini/config/Icons/icons.zip"
 
@@ -27,6 +28,10 @@ def run() -> None:
 
     app = get_qapplication(create_if_missing=is_vscode)
 
+    # Rendered SVG pixmaps are kept in the application-wide QPixmapCache;
+    # 64 MB holds several thousand small icons while bounding memory.
+    QtGui.QPixmapCache.setCacheLimit(64 * 1024)
+
     window = HoudiniIconBrowserWindow(zip_path)
 
     apply_standalone_window_policy(
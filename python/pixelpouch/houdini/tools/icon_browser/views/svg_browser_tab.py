@@ -6,6 +6,7 @@ archive. Icons are shown in an icon-based list view with filtering and
 lazy icon loading support.
 """
 
+import zipfile
 from pathlib import Path
 
 from pixelpouch.houdini.tools.icon_browser.delegates.svg_icon_delegate import (
@@ -19,7 +20,7 @@ from pixelpouch.houdini.tools.icon_browser.models.svg_filter_model import (
 )
 from pixelpouch.houdini.tools.icon_browser.views.ui_svg_browser_tab import Ui_Form
 from pixelpouch.libs.core.logging_factory import PixelPouchLoggerFactory
-from PySide6 import QtWidgets
+from PySide6 import QtCore, QtGui, QtWidgets
 
 logger = PixelPouchLoggerFactory.get_logger(__name__)
 
@@ -36,6 +37,7 @@ class SvgBrowserTab(QtWidgets.QWidget):
         self,
         zip_path: Path,
         svg_paths: list[str],
+        zip_file: zipfile.ZipFile | None = None,
         parent: QtWidgets.QWidget | None = None,
     ) -> None:
         """Initializes the SVG browser tab.
@@ -43,6 +45,8 @@ class SvgBrowserTab(QtWidgets.QWidget):
         Args:
             zip_path: Path to the ZIP archive containing SVG files.
             svg_paths: List of SVG file paths belonging to this tab.
+            zip_file: Optional already-open handle on ``zip_path`` shared
+                across tabs.
             parent: Optional Qt parent widget.
         """
         super().__init__(parent)
@@ -56,30 +60,106 @@ class SvgBrowserTab(QtWidgets.QWidget):
             QtWidgets.QAbstractItemView.SelectionMode.SingleSelection
         )
 
-        self.source_model = SvgZipListModel(zip_path, svg_paths)
+        # Render at the physical pixel size for this screen so QIcon.paint
+        # blits 1:1 instead of rescaling per frame on HiDPI displays.
+        ratio = self.devicePixelRatioF()
+        self.source_model = SvgZipListModel(
+            zip_path,
+            svg_paths,
+            icon_size=round(32 * ratio),
+            device_pixel_ratio=ratio,
+            zip_file=zip_file,
+        )
         self.proxy_model = SvgFilterProxyModel(self)
         self.proxy_model.setSourceModel(self.source_model)
 
         self._ui.listView.setModel(self.proxy_model)
         self._ui.listView.setItemDelegate(SvgIconDelegate(self._ui.listView))
 
+        self._ui.listView.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+
+        # Refiltering is O(rows); debouncing coalesces a typing burst into
+        # a single filter pass once the user pauses.
+        self._pending_text = ""
+        self._search_timer = QtCore.QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._do_filter)
+
+    def _on_scrolled(self, _value: int) -> None:
+        """Prewarms icons around the scroll viewport on scroll.
+
+        Args:
+            _value: New scroll bar value (unused).
+        """
+        self._prewarm_viewport()
+
+    def _prewarm_viewport(self) -> None:
+        """Requests icons for the visible rows plus one page of lookahead.
+
+        Icon rendering happens on background threads, but requesting icons
+        only at paint time still causes a visible pop-in. Restricting
+        requests to the viewport (rather than the first N rows) means no
+        worker is spawned for rows the user may never scroll to.
+        """
+        view = self._ui.listView
+        viewport_rect = view.viewport().rect()
+
+        first = view.indexAt(viewport_rect.topLeft())
+        if not first.isValid():
+            return
+
+        last = view.indexAt(viewport_rect.bottomRight())
+        start = first.row()
+        end = last.row() if last.isValid() else self.proxy_model.rowCount() - 1
+
+        page = max(1, end - start + 1)
+        lo = max(0, start - page)
+        hi = min(self.proxy_model.rowCount() - 1, end + page)
+
+        keep = {
+            self.proxy_model.mapToSource(self.proxy_model.index(row, 0)).row()
+            for row in range(lo, hi + 1)
+        }
+        center_proxy = self.proxy_model.index((start + end) // 2, 0)
+        self.source_model.set_viewport_center(
+            self.proxy_model.mapToSource(center_proxy).row()
+        )
+        # Rows scrolled far outside the window release their queued or
+        # in-flight renders so visible rows are not stuck behind them.
+        self.source_model.cancel_requests_except(keep)
+        self.source_model.prewarm(sorted(keep))
+
+    def showEvent(self, event: "QtGui.QShowEvent") -> None:
+        """Prewarms the initial viewport when the tab first becomes visible.
+
+        Args:
+            event: Qt show event.
+        """
+        super().showEvent(event)
+        self._prewarm_viewport()
+
+    def _do_filter(self) -> None:
+        """Applies the most recent pending search text to the proxy."""
+        self.proxy_model.setFilterText(self._pending_text)
+
     # Public API
     def apply_search(self, text: str) -> None:
         """Applies a text-based filter to the SVG list.
 
+        The filter itself is debounced: rapid keystrokes restart a short
+        timer and only the final text triggers a refilter.
+
         Args:
             text: Search text used to filter SVG entries.
         """
-        self.proxy_model.setFilterRegularExpression(text)
+        self._pending_text = text
+        self._search_timer.start()
 
-    def preload_icons(self, limit: int = 15) -> None:
-        """Preloads a limited number of SVG icons.
+    def preload_icons(self) -> None:
+        """Preloads icons for the rows currently in (or near) the viewport.
 
-        This method triggers asynchronous icon generation for the first
-        ``limit`` rows in the source model.
-
-        Args:
-            limit: Maximum number of icons to preload.
+        Unlike a fixed first-N preload, this only spawns workers for rows
+        the user can actually see, plus one page of lookahead.
         """
-        for row in range(min(limit, self.source_model.rowCount())):
-            self.source_model.request_icon(row)
+        self._prewarm_viewport()
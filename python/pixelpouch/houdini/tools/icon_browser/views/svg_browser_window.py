@@ -18,6 +18,7 @@ from pixelpouch.libs.core.logging_factory import (
     PixelPouchLoggerFactory,
 )
 from pixelpouch.libs.core.qt.widgets import WheelTabBar
+from pixelpouch.libs.core.utility import open_zip_cached
 from PySide6 import QtCore, QtWidgets
 
 logger = PixelPouchLoggerFactory.get_logger(__name__)
@@ -54,6 +55,9 @@ class HoudiniIconBrowserWindow(QtWidgets.QWidget):
         self._ui.tabWidget.currentChanged.connect(self._on_tab_changed)
 
         self._zip_path = zip_path
+        # One handle serves grouping and every tab's model; the central
+        # directory is parsed once per archive instead of once per tab.
+        self._zip_file = open_zip_cached(str(zip_path))
         self._preloaded_tabs: set[int] = set()
 
         self.setWindowTitle("Houdini Icon Browser")
@@ -70,6 +74,7 @@ class HoudiniIconBrowserWindow(QtWidgets.QWidget):
             tab = SvgBrowserTab(
                 zip_path=self._zip_path,
                 svg_paths=svg_paths,
+                zip_file=self._zip_file,
                 parent=self._ui.tabWidget,
             )
 
@@ -79,6 +84,12 @@ class HoudiniIconBrowserWindow(QtWidgets.QWidget):
 
             self._ui.tabWidget.addTab(tab, category)
 
+            # Warm the head of every tab while the window is settling:
+            # the batch workers decode in parallel on the thread pool, so
+            # switching to another tab usually finds its first rows
+            # already cached.
+            tab.source_model.prewarm(range(min(15, len(svg_paths))))
+
     def _current_tab(self) -> SvgBrowserTab | None:
         """Returns the currently active SVG browser tab.
 
@@ -140,7 +151,7 @@ class HoudiniIconBrowserWindow(QtWidgets.QWidget):
         # Preload icons on first activation only
         if index not in self._preloaded_tabs:
             self._preloaded_tabs.add(index)
-            tab.preload_icons(limit=15)
+            tab.preload_icons()
 
         # Update the selected SVG display
         sel = tab._ui.listView.currentIndex()
@@ -1,10 +1,29 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
+from typing import Any, Mapping
 
 
-class WidgetModel(BaseModel):
+@dataclass(slots=True, frozen=True)
+class WidgetModel:
     name: str
     widget: str
 
 
-class WidgetListModel(BaseModel):
+@dataclass(slots=True, frozen=True)
+class WidgetListModel:
     widgets: list[WidgetModel]
+
+    @classmethod
+    def from_json(cls, data: Mapping[str, Any]) -> "WidgetListModel":
+        """Builds the model from parsed palette JSON.
+
+        The schema is two string fields per entry; plain dataclasses
+        parse it without pulling pydantic into the Houdini startup
+        import graph.
+
+        Args:
+            data: Parsed JSON mapping with a ``widgets`` list.
+
+        Returns:
+            The populated widget list model.
+        """
+        return cls(widgets=[WidgetModel(**entry) for entry in data["widgets"]])
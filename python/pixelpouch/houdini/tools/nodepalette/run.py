@@ -1,14 +1,80 @@
-from typing import Optional
+import importlib
+import os
+from typing import TYPE_CHECKING, Optional
 
-from pixelpouch.houdini.tools.nodepalette.views.window import NodePaletteWindow
+from pixelpouch.houdini.tools.nodepalette import controller, widget_factory
+from pixelpouch.houdini.tools.nodepalette.views import window as window_module
 from PySide6 import QtCore, QtWidgets
 
+if TYPE_CHECKING:
+    from pixelpouch.houdini.tools.nodepalette.views.window import (
+        NodePaletteWindow,
+    )
+
+# Reopening the palette from a shelf tool should raise the existing
+# window, not rebuild it; the reference is dropped when Qt destroys it.
+_window: Optional["NodePaletteWindow"] = None
+
+# Modules worth reloading during development. Data models and the widget
+# factory schema rarely change; reloading everything matching
+# "nodepalette" in sys.modules re-parses far more than necessary.
+_LEAF_MODULES = (controller, widget_factory, window_module)
+_module_mtimes: dict[str, float] = {
+    module.__file__: os.path.getmtime(module.__file__)
+    for module in _LEAF_MODULES
+    if module.__file__ is not None
+}
+
+
+def _on_window_destroyed() -> None:
+    global _window
+    _window = None
+
 
 def run(parent: Optional[QtWidgets.QMainWindow] = None) -> None:
-    window = NodePaletteWindow(parent)
-    window.setWindowFlags(QtCore.Qt.WindowType.Window)
-    window.resize(300, 200)
-    window.show()
+    global _window
+    if _window is not None:
+        _window.show()
+        _window.raise_()
+        _window.activateWindow()
+        return
+
+    _window = window_module.NodePaletteWindow(parent)
+    _window.setWindowFlags(QtCore.Qt.WindowType.Window)
+    _window.resize(300, 200)
+    _window.destroyed.connect(_on_window_destroyed)
+    _window.show()
+
+
+def reload_and_show(parent: Optional[QtWidgets.QMainWindow] = None) -> None:
+    """Reloads palette modules that changed on disk and reopens the window.
+
+    Development helper: only the leaf modules whose files have a newer
+    mtime than at the last (re)load are re-imported, instead of looping
+    importlib.reload over everything in sys.modules.
+
+    Args:
+        parent: Optional parent window for the rebuilt palette.
+    """
+    global _window
+
+    reloaded = False
+    for module in _LEAF_MODULES:
+        path = module.__file__
+        if path is None:
+            continue
+        mtime = os.path.getmtime(path)
+        if mtime != _module_mtimes.get(path):
+            importlib.reload(module)
+            _module_mtimes[path] = mtime
+            reloaded = True
+
+    if reloaded and _window is not None:
+        _window.close()
+        _window.deleteLater()
+        _window = None
+
+    run(parent)
 
 
 if __name__ == "__main__":
@@ -7,6 +7,7 @@ a widget factory. Selecting an item triggers node creation through the
 associated controller.
 """
 
+import functools
 import json
 from pathlib import Path
 from typing import Any, Optional
@@ -22,7 +23,7 @@ from pixelpouch.houdini.tools.nodepalette.widget_factory import (
 )
 from pixelpouch.libs.core.logging_factory import PixelPouchLoggerFactory
 from pixelpouch.libs.core.parsing.qss import loader
-from PySide6 import QtCore, QtWidgets
+from PySide6 import QtCore, QtGui, QtWidgets
 
 logger = PixelPouchLoggerFactory.get_logger(__name__)
 
@@ -34,6 +35,64 @@ SOP_CAT: hou.OpNodeTypeCategory = hou.sopNodeTypeCategory()
 QSSLOADER = loader.QssLoader(DATA_DIR)
 
 
+@functools.lru_cache(maxsize=1)
+def _load_qss() -> str:
+    """Loads the palette stylesheet once per process.
+
+    Reading and resolving the QSS on every window construction is pure
+    I/O on the reopen path; the sheet is static for a running session.
+
+    Returns:
+        The resolved stylesheet text.
+    """
+    return QSSLOADER.load(QSS_FILE)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_palette_spec() -> tuple[tuple[hou.NodeType, str, str], ...]:
+    """Loads and resolves the palette definition once per process.
+
+    JSON parsing, building the widget dataclasses, and the per-entry
+    hou.nodeType / icon-name / description lookups all happen on the
+    GUI init path;
+    caching the fully resolved spec means reopening the palette window
+    skips them entirely. Unsupported widget types or missing node types
+    are logged and skipped here, once. Icon rasterization is deliberately
+    not done here — the window resolves icons lazily after showing.
+
+    Returns:
+        Tuple of (node type, icon name, description) entries in palette
+        order.
+    """
+    with open(DATA_FILE) as f:
+        data: dict[str, Any] = json.load(f)
+
+    widget_list_model = WidgetListModel.from_json(data)
+
+    # One cross-boundary call returning every SOP node type beats one
+    # hou.nodeType() round trip per palette entry.
+    node_types: dict[str, hou.NodeType] = SOP_CAT.nodeTypes()
+
+    spec: list[tuple[hou.NodeType, str, str]] = []
+    for widget_model in widget_list_model.widgets:
+        if widget_model.widget not in WIDGET_FACTORY:
+            logger.error(f"Unsupported widget type: {widget_model.widget}")
+            continue
+        node_type = node_types.get(widget_model.name)
+        if node_type is None:
+            logger.warning(f"NodeType not found: {widget_model.name}")
+            continue
+
+        spec.append((node_type, node_type.icon(), node_type.description()))
+
+    return tuple(spec)
+
+
+# Rasterized hou.qt.Icon results shared across window instances, keyed by
+# icon name (many node types share icons).
+_ICON_CACHE: dict[str, QtGui.QIcon] = {}
+
+
 class NodePaletteWindow(QtWidgets.QWidget):
     """Main window for displaying and interacting with a node palette.
 
@@ -47,6 +106,9 @@ class NodePaletteWindow(QtWidgets.QWidget):
     SPACING = 6
     ITEM_SIZE = ICON_SIZE + SPACING
 
+    # Icons resolved per event-loop turn while filling in lazily.
+    ICON_BATCH_SIZE = 20
+
     def __init__(
         self,
         parent: Optional[QtWidgets.QWidget] = None,
@@ -69,42 +131,76 @@ class NodePaletteWindow(QtWidgets.QWidget):
         self._ui.listWidget.setMovement(QtWidgets.QListView.Movement.Static)
         self._ui.listWidget.setSpacing(self.SPACING)
         self._ui.listWidget.setUniformItemSizes(True)
+        self._ui.listWidget.setFlow(QtWidgets.QListView.Flow.LeftToRight)
+        # Batched layout computes geometry for chunks of items per event
+        # loop turn, so large palettes lay out O(visible) instead of O(N)
+        # before first paint.
+        self._ui.listWidget.setLayoutMode(QtWidgets.QListView.LayoutMode.Batched)
+        self._ui.listWidget.setBatchSize(32)
         self._ui.listWidget.setIconSize(QtCore.QSize(self.ICON_SIZE, self.ICON_SIZE))
         self._ui.listWidget.setGridSize(QtCore.QSize(self.ITEM_SIZE, self.ITEM_SIZE))
-        self._ui.listWidget.setStyleSheet(QSSLOADER.load(QSS_FILE))
-
-        with open(DATA_FILE) as f:
-            data: dict[str, Any] = json.load(f)
+        self._ui.listWidget.setStyleSheet(_load_qss())
 
         self.controller = NodePaletteController()
 
-        self.widget_list_model = WidgetListModel.model_validate(data)
         self._create_widgets()
         self._setup_connections()
 
     def _create_widgets(self) -> None:
-        """Creates and populates list widget items from the widget model.
+        """Creates and populates list widget items from the palette spec.
 
-        For each widget definition, this method resolves the corresponding
-        Houdini node type, creates a list item with icon and metadata, and
-        adds it to the list widget. Unsupported widget types or missing
-        node types are logged and skipped.
+        The spec is fully resolved (and validated) once per process by
+        ``_load_palette_spec``, so this is just a tight loop building
+        list items. Updates and signals are suspended for the duration:
+        every addItem otherwise triggers its own relayout and viewport
+        update.
+        """
+        list_widget = self._ui.listWidget
+        list_widget.setUpdatesEnabled(False)
+        list_widget.blockSignals(True)
+        try:
+            for _node_type, icon_name, description in _load_palette_spec():
+                item = QtWidgets.QListWidgetItem()
+                icon = _ICON_CACHE.get(icon_name)
+                if icon is not None:
+                    item.setIcon(icon)
+                item.setToolTip(description)
+                list_widget.addItem(item)
+        finally:
+            list_widget.blockSignals(False)
+            list_widget.setUpdatesEnabled(True)
+        list_widget.viewport().update()
+
+        # Rasterizing every hou.qt.Icon up front blocks window open; fill
+        # the missing ones in small batches once the event loop is idle.
+        self._next_icon_row = 0
+        QtCore.QTimer.singleShot(0, self._resolve_icon_batch)
+
+    def _resolve_icon_batch(self) -> None:
+        """Resolves the next batch of palette icons lazily.
+
+        Icons already rasterized for this process were set during item
+        creation from the shared cache; this fills in the rest a batch
+        per event-loop turn so the window stays responsive.
         """
-        for widget_model in self.widget_list_model.widgets:
-            factory = WIDGET_FACTORY.get(widget_model.widget)
-            if factory is None:
-                logger.error(f"Unsupported widget type: {widget_model.widget}")
-                continue
-            node_type = hou.nodeType(SOP_CAT, widget_model.name)
-            if node_type is None:
-                logger.warning("NodeType not found: {widget_model.name}")
-                continue
-
-            item = QtWidgets.QListWidgetItem()
-            item.setIcon(hou.qt.Icon(node_type.icon()))
-            item.setToolTip(node_type.description())
-            item.setData(QtCore.Qt.ItemDataRole.UserRole, node_type)
-            self._ui.listWidget.addItem(item)
+        spec = _load_palette_spec()
+        end = min(self._next_icon_row + self.ICON_BATCH_SIZE, len(spec))
+
+        for row in range(self._next_icon_row, end):
+            icon_name = spec[row][1]
+            icon = _ICON_CACHE.get(icon_name)
+            if icon is None:
+                # Rasterize at exactly the displayed size; Houdini's
+                # default is larger and would be scaled down per paint.
+                icon = hou.qt.Icon(icon_name, self.ICON_SIZE, self.ICON_SIZE)
+                _ICON_CACHE[icon_name] = icon
+            item = self._ui.listWidget.item(row)
+            if item is not None and item.icon().isNull():
+                item.setIcon(icon)
+
+        self._next_icon_row = end
+        if end < len(spec):
+            QtCore.QTimer.singleShot(0, self._resolve_icon_batch)
 
     def _setup_connections(self) -> None:
         """Sets up Qt signal-slot connections for the window."""
@@ -113,11 +209,12 @@ class NodePaletteWindow(QtWidgets.QWidget):
     def _on_item_clicked(self, item: QtWidgets.QListWidgetItem) -> None:
         """Handles list item selection and triggers node creation.
 
-        The selected item's associated Houdini node type is retrieved and
-        passed to the controller to create a new node instance.
+        The clicked row indexes straight into the frozen palette spec;
+        node types are no longer boxed into each item's UserRole.
 
         Args:
             item: The list widget item that was clicked.
         """
-        node_type: hou.NodeType = item.data(QtCore.Qt.ItemDataRole.UserRole)
+        row = self._ui.listWidget.row(item)
+        node_type: hou.NodeType = _load_palette_spec()[row][0]
         self.controller.create(node_type=node_type.name())
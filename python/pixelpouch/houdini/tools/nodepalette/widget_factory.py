@@ -5,6 +5,8 @@ from PySide6 import QtWidgets
 WidgetFactory = dict[str, Callable[[str], QtWidgets.QWidget]]
 
 
+# The classes themselves are the factories: calling the class constructs
+# the widget directly, without a lambda frame per instantiation.
 WIDGET_FACTORY: WidgetFactory = {
-    "QPushButton": lambda name: QtWidgets.QPushButton(name),
+    "QPushButton": QtWidgets.QPushButton,
 }
@@ -9,16 +9,33 @@ provides a dedicated exception type for environment-related errors.
 from __future__ import annotations
 
 import os
+import re
 from abc import ABC
 from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional, Type, TypeVar
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Callable, Mapping
 
 _TEnum = TypeVar("_TEnum", bound=Enum)
 
+# Parsed values memoized by (kind, raw string). Environment values are a
+# tiny, highly repetitive domain ("1", "true", port numbers, ...), so
+# repeated reads across accessor instances reduce to one dict hit
+# instead of re-running conversion and its exception setup.
+_UNSET: object = object()
+_PARSE_CACHE: dict[tuple[object, str], object] = {}
+
+# Validated enum types mapped to their value-to-member tables, so the
+# issubclass check and attribute lookup run once per enum type.
+_ENUM_MEMBER_MAPS: dict[type, dict[object, Enum]] = {}
+
+# Accepted boolean spellings, hoisted to module level so membership is a
+# hashed frozenset lookup instead of a linear tuple scan per call.
+_BOOL_TRUE = frozenset(("y", "yes", "t", "true", "on", "1"))
+_BOOL_FALSE = frozenset(("n", "no", "f", "false", "off", "0"))
+
 
 def _parse_bool(value: str) -> bool:
     """Parse a string into a boolean value.
@@ -37,13 +54,28 @@ def _parse_bool(value: str) -> bool:
         ValueError: If the string cannot be interpreted as a boolean.
     """
     normalized = value.lower().strip()
-    if normalized in ("y", "yes", "t", "true", "on", "1"):
+    if normalized in _BOOL_TRUE:
         return True
-    if normalized in ("n", "no", "f", "false", "off", "0"):
+    if normalized in _BOOL_FALSE:
         return False
     raise ValueError(f"Cannot convert '{value}' to boolean")
 
 
+# Parser table backing _read_typed: one shared skeleton replaces six
+# near-identical read methods, keeping their bytecode small and their
+# error messages uniform.
+_PARSERS: dict[str, Callable[[str], object]] = {
+    "int": int,
+    "float": float,
+    "bool": _parse_bool,
+}
+_KIND_LABELS = {"int": "an integer", "float": "a float", "bool": "a boolean"}
+
+# Splits on the default path-list separator and consumes surrounding
+# whitespace in the same C-level scan, replacing a per-element strip.
+_SPLIT_STRIP_SEMICOLON = re.compile(r"\s*;\s*")
+
+
 class EnvironmentVariableError(RuntimeError):
     """Error raised when an environment variable is missing or invalid.
 
@@ -60,6 +92,11 @@ class AppEnvironmentVariables(ABC):
     are expected to define their own public attributes using these helpers.
     """
 
+    # Accessors are small fixed-shape value objects; slots drop the
+    # per-instance dict and make attribute reads a descriptor lookup.
+    # Subclasses must declare their own __slots__ as well.
+    __slots__ = ("_env",)
+
     def __init__(self, env: Optional[Mapping[str, str]] = None) -> None:
         """Initialize the environment variable accessor.
 
@@ -125,7 +162,13 @@ class AppEnvironmentVariables(ABC):
         Raises:
             EnvironmentVariableError: If the variable is not defined.
         """
-        return Path(cls._read_str(env, key))
+        value = cls._read_str(env, key)
+        cached = _PARSE_CACHE.get(("path", value), _UNSET)
+        if cached is not _UNSET:
+            return cached  # type: ignore[return-value]
+        parsed = Path(value)
+        _PARSE_CACHE[("path", value)] = parsed
+        return parsed
 
     @classmethod
     def _read_path_list(
@@ -152,44 +195,105 @@ class AppEnvironmentVariables(ABC):
             is not defined.
         """
         value = env.get(key)
-        if value is None:
+        if not value:
             return []
 
-        return [
-            Path(path)
-            for path in value.split(separator)
-            if not remove_empty_or_whitespace or path.strip()
-        ]
+        if not remove_empty_or_whitespace:
+            return [Path(path) for path in value.split(separator)]
+
+        if separator == ";":
+            # One regex pass splits and strips every segment at C speed;
+            # the outer strip handles whitespace at the value's ends.
+            parts = _SPLIT_STRIP_SEMICOLON.split(value.strip())
+            return [Path(part) for part in parts if part]
+
+        # Reuse the stripped segment instead of stripping once for the
+        # truthiness test and converting the unstripped original.
+        paths: list[Path] = []
+        for part in value.split(separator):
+            part = part.strip()
+            if part:
+                paths.append(Path(part))
+        return paths
 
     @classmethod
-    def _read_bool_opt(cls, env: Mapping[str, str], key: str) -> Optional[bool]:
-        """Read an optional boolean environment variable.
+    def _read_typed(
+        cls,
+        env: Mapping[str, str],
+        key: str,
+        kind: str,
+        required: bool = True,
+    ) -> object:
+        """Read and parse an environment variable of a registered kind.
+
+        This is the shared skeleton behind the typed read methods: fetch,
+        missing/empty handling, parse via the ``_PARSERS`` table with the
+        result memoized per raw value, and uniform error reporting.
 
         Args:
             env: Environment variable mapping.
             key: Environment variable name.
+            kind: Parser name in ``_PARSERS`` ("int", "float" or "bool").
+            required: Whether a missing variable is an error.
 
         Returns:
-            ``True`` or ``False`` if the variable is defined, otherwise ``None``.
+            The parsed value; ``None`` when an optional variable is
+            missing (or empty, for numeric kinds); ``False`` for an
+            empty boolean.
 
         Raises:
-            EnvironmentVariableError: If the value cannot be interpreted
-                as a boolean.
+            EnvironmentVariableError: If a required variable is missing
+                or the value cannot be parsed.
         """
         value = env.get(key)
         if value is None:
+            if required:
+                raise EnvironmentVariableError(
+                    f"Environment variable '{key}' is not defined."
+                )
             return None
 
-        value = value.strip()
+        # Values set from shells or config files rarely carry surrounding
+        # whitespace; strip() always allocates on hit, so only call it
+        # when the ends are actually whitespace.
+        if value and (value[0].isspace() or value[-1].isspace()):
+            value = value.strip()
         if not value:
-            return False
+            if kind == "bool":
+                return False
+            if not required:
+                return None
+
+        cached = _PARSE_CACHE.get((kind, value), _UNSET)
+        if cached is not _UNSET:
+            return cached
 
         try:
-            return _parse_bool(value)
+            parsed = _PARSERS[kind](value)
         except ValueError as e:
             raise EnvironmentVariableError(
-                f"Environment variable '{key}' must be a boolean, got '{value}'."
+                f"Environment variable '{key}' must be "
+                f"{_KIND_LABELS[kind]}, got '{value}'."
             ) from e
+        _PARSE_CACHE[(kind, value)] = parsed
+        return parsed
+
+    @classmethod
+    def _read_bool_opt(cls, env: Mapping[str, str], key: str) -> Optional[bool]:
+        """Read an optional boolean environment variable.
+
+        Args:
+            env: Environment variable mapping.
+            key: Environment variable name.
+
+        Returns:
+            ``True`` or ``False`` if the variable is defined, otherwise ``None``.
+
+        Raises:
+            EnvironmentVariableError: If the value cannot be interpreted
+                as a boolean.
+        """
+        return cls._read_typed(env, key, "bool", required=False)  # type: ignore[return-value]
 
     @classmethod
     def _read_bool(cls, env: Mapping[str, str], key: str) -> bool:
@@ -206,22 +310,7 @@ class AppEnvironmentVariables(ABC):
             EnvironmentVariableError: If the variable is missing or cannot
                 be interpreted as a boolean.
         """
-        value = env.get(key)
-        if value is None:
-            raise EnvironmentVariableError(
-                f"Environment variable '{key}' is not defined."
-            )
-
-        value = value.strip()
-        if not value:
-            return False
-
-        try:
-            return _parse_bool(value)
-        except ValueError as e:
-            raise EnvironmentVariableError(
-                f"Environment variable '{key}' must be a boolean, got '{value}'."
-            ) from e
+        return cls._read_typed(env, key, "bool")  # type: ignore[return-value]
 
     @classmethod
     def _read_enum_opt(
@@ -245,20 +334,27 @@ class AppEnvironmentVariables(ABC):
             EnvironmentVariableError: If the value cannot be converted to
                 the specified enum.
         """
-        if not issubclass(enum_type, Enum):
-            raise TypeError(f"'{enum_type}' is not a subclass of Enum.")
+        # The subclass check runs once per enum type; afterwards the
+        # lookup goes straight through the enum's value-to-member map,
+        # skipping Enum.__call__ and its exception machinery.
+        member_map = _ENUM_MEMBER_MAPS.get(enum_type)
+        if member_map is None:
+            if not issubclass(enum_type, Enum):
+                raise TypeError(f"'{enum_type}' is not a subclass of Enum.")
+            member_map = enum_type._value2member_map_
+            _ENUM_MEMBER_MAPS[enum_type] = member_map
 
         value = env.get(key)
         if value is None:
             return None
 
-        try:
-            return enum_type(value)
-        except ValueError as e:
+        member = member_map.get(value)
+        if member is None:
             raise EnvironmentVariableError(
                 f"Environment variable '{key}' must be one of "
                 f"{[e.value for e in enum_type]}, got '{value}'."
-            ) from e
+            )
+        return member  # type: ignore[return-value]
 
     @classmethod
     def _read_int(cls, env: Mapping[str, str], key: str) -> int:
@@ -275,13 +371,7 @@ class AppEnvironmentVariables(ABC):
             EnvironmentVariableError: If the variable is missing or cannot
                 be converted to an integer.
         """
-        value = cls._read_str(env, key)
-        try:
-            return int(value)
-        except ValueError as e:
-            raise EnvironmentVariableError(
-                f"Environment variable '{key}' must be an integer, got '{value}'."
-            ) from e
+        return cls._read_typed(env, key, "int")  # type: ignore[return-value]
 
     @classmethod
     def _read_int_opt(cls, env: Mapping[str, str], key: str) -> Optional[int]:
@@ -298,20 +388,7 @@ class AppEnvironmentVariables(ABC):
             EnvironmentVariableError: If the value cannot be converted
                 to an integer.
         """
-        value = env.get(key)
-        if value is None:
-            return None
-
-        value = value.strip()
-        if not value:
-            return None
-
-        try:
-            return int(value)
-        except ValueError as e:
-            raise EnvironmentVariableError(
-                f"Environment variable '{key}' must be an integer, got '{value}'."
-            ) from e
+        return cls._read_typed(env, key, "int", required=False)  # type: ignore[return-value]
 
     @classmethod
     def _read_float(cls, env: Mapping[str, str], key: str) -> float:
@@ -328,13 +405,7 @@ class AppEnvironmentVariables(ABC):
             EnvironmentVariableError: If the variable is missing or cannot
                 be converted to a float.
         """
-        value = cls._read_str(env, key)
-        try:
-            return float(value)
-        except ValueError as e:
-            raise EnvironmentVariableError(
-                f"Environment variable '{key}' must be a float, got '{value}'."
-            ) from e
+        return cls._read_typed(env, key, "float")  # type: ignore[return-value]
 
     @classmethod
     def _read_float_opt(cls, env: Mapping[str, str], key: str) -> Optional[float]:
@@ -351,17 +422,4 @@ class AppEnvironmentVariables(ABC):
             EnvironmentVariableError: If the value cannot be converted
                 to a float.
         """
-        value = env.get(key)
-        if value is None:
-            return None
-
-        value = value.strip()
-        if not value:
-            return None
-
-        try:
-            return float(value)
-        except ValueError as e:
-            raise EnvironmentVariableError(
-                f"Environment variable '{key}' must be a float, got '{value}'."
-            ) from e
+        return cls._read_typed(env, key, "float", required=False)  # type: ignore[return-value]
@@ -1,3 +1,13 @@
-from .debug_attach import DebugpyRuntime, ProcessWatchdog
+from .debug_attach import (
+    DebugpyRuntime,
+    ProcessWatchdog,
+    resume_tracing,
+    suspend_tracing,
+)
 
-__all__ = ["DebugpyRuntime", "ProcessWatchdog"]
+__all__ = [
+    "DebugpyRuntime",
+    "ProcessWatchdog",
+    "resume_tracing",
+    "suspend_tracing",
+]
@@ -12,18 +12,39 @@ import json
 import logging
 import socket
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
+
+from pixelpouch.libs.core.debug.protocol import recv_msg, send_msg
+
+# orjson serializes straight to UTF-8 bytes in native code, which matters
+# for responses carrying large stdout/stderr captures; the stdlib is a
+# drop-in fallback when it is not installed.
+try:
+    import orjson
+
+    def _dumps(obj: object) -> bytes:
+        return orjson.dumps(obj)
+
+    def _loads(data: bytes) -> Any:  # noqa: ANN401
+        return orjson.loads(data)
+
+except ImportError:
+
+    def _dumps(obj: object) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def _loads(data: bytes) -> Any:  # noqa: ANN401
+        return json.loads(data)
 
 # ----------------------------------------------------------------------
 # logging (stdlib only)
 # ----------------------------------------------------------------------
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(levelname)s] %(message)s",
-)
+# basicConfig is only applied in _main: importing this module as a
+# library must not install a root handler or touch the caller's
+# logging setup.
 logger = logging.getLogger(__name__)
 
 
@@ -45,13 +66,59 @@ class SendPythonClient:
     """TCP client for sending Python code to a DCC process.
 
     This class is transport-only and does not perform any printing.
+
+    Used as a context manager, one connection is held open and reused
+    for every ``send_code`` call, amortizing the TCP handshake across
+    a session of snippets. Outside a ``with`` block each call opens a
+    one-shot connection as before.
     """
 
     host: str = "127.0.0.1"
     port: int = 7001
     timeout: float = 3.0
     encoding: str = "utf-8"
-    buffer_size: int = 1024 * 1024
+
+    _sock: Optional[socket.socket] = field(default=None, init=False)
+
+    # -------------------------------------------------------------
+
+    def __enter__(self) -> SendPythonClient:
+        self.connect()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def connect(self) -> None:
+        """Open the persistent connection (idempotent)."""
+        if self._sock is None:
+            self._sock = self._open_socket()
+
+    def close(self) -> None:
+        """Close the persistent connection if open."""
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def _open_socket(self) -> socket.socket:
+        sock = socket.create_connection(
+            (self.host, self.port),
+            timeout=self.timeout,
+        )
+        # Requests are tiny; waiting for Nagle coalescing only adds
+        # latency to every round trip.
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+
+    def _roundtrip(self, sock: socket.socket, payload: bytes) -> bytes | None:
+        send_msg(sock, payload)
+        logger.info(
+            "Sent %d bytes to %s:%d",
+            len(payload),
+            self.host,
+            self.port,
+        )
+        return recv_msg(sock)
 
     # -------------------------------------------------------------
 
@@ -64,23 +131,15 @@ class SendPythonClient:
         request = {"code": code}
 
         try:
-            with socket.create_connection(
-                (self.host, self.port),
-                timeout=self.timeout,
-            ) as sock:
-                payload = json.dumps(request).encode(self.encoding)
-                sock.sendall(payload)
-
-                logger.info(
-                    "Sent %d bytes to %s:%d",
-                    len(payload),
-                    self.host,
-                    self.port,
-                )
-
-                response_bytes = sock.recv(self.buffer_size)
-                if not response_bytes:
-                    raise RuntimeError("No response received from DCC")
+            payload = _dumps(request)
+            if self._sock is not None:
+                response_bytes = self._roundtrip(self._sock, payload)
+            else:
+                with self._open_socket() as sock:
+                    response_bytes = self._roundtrip(sock, payload)
+
+            if not response_bytes:
+                raise RuntimeError("No response received from DCC")
 
         except Exception as exc:
             logger.error(
@@ -92,7 +151,7 @@ class SendPythonClient:
             raise RuntimeError("Failed to send Python code to DCC") from exc
 
         try:
-            response: Response = json.loads(response_bytes.decode(self.encoding))
+            response: Response = _loads(response_bytes)
         except Exception as exc:
             raise RuntimeError("Invalid response from DCC") from exc
 
@@ -115,6 +174,11 @@ class SendPythonClient:
 
 
 def _main(argv: list[str]) -> int:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[%(levelname)s] %(message)s",
+    )
+
     if len(argv) != 2:
         logger.error("Usage: %s <python_file>", Path(argv[0]).name)
         return 1
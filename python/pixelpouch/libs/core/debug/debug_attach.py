@@ -7,21 +7,66 @@ immediately to avoid orphaned helper processes.
 """
 
 import os
+import sys
 import threading
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import ModuleType
 from typing import Optional
 
-import debugpy
-import psutil
 from pixelpouch.libs.core.environment_variable_key import (
-    PixelPouchEnvironmentVariables,
+    get_pixelpouch_environment_variables,
 )
 from pixelpouch.libs.core.logging_factory import PixelPouchLoggerFactory
 
 logger = PixelPouchLoggerFactory.get_logger(__name__)
-PP_ENV = PixelPouchEnvironmentVariables()
+PP_ENV = get_pixelpouch_environment_variables()
+
+
+def suspend_tracing() -> None:
+    """Disable debugger tracing after a client disconnect.
+
+    Once ``debugpy.listen`` has been called, the pydevd tracer stays active
+    for the rest of the session and slows down every Python frame, even when
+    no client is attached. Calling this function stops the tracer (and, on
+    Python 3.12+, releases the ``sys.monitoring`` debugger tool id) so that
+    unattached time has near-zero overhead.
+    """
+    try:
+        import pydevd
+
+        pydevd.stoptrace()
+        logger.info("[Houdini] debugger tracing suspended")
+    except Exception:
+        logger.exception("[Houdini] failed to suspend debugger tracing")
+        return
+
+    monitoring = getattr(sys, "monitoring", None)
+    if monitoring is None:
+        return
+
+    try:
+        monitoring.set_events(monitoring.DEBUGGER_ID, 0)
+        monitoring.free_tool_id(monitoring.DEBUGGER_ID)
+    except Exception:
+        # The debugger tool id may not be registered; nothing to release.
+        logger.debug("[Houdini] sys.monitoring debugger tool id not in use")
+
+
+def resume_tracing() -> None:
+    """Re-enable debugger tracing for a new client attach.
+
+    This is the counterpart to :func:`suspend_tracing`. It restores the
+    pydevd tracer so that a re-attaching client can hit breakpoints again.
+    """
+    try:
+        import pydevd
+
+        pydevd.settrace(suspend=False)
+        logger.info("[Houdini] debugger tracing resumed")
+    except Exception:
+        logger.exception("[Houdini] failed to resume debugger tracing")
 
 
 @dataclass(slots=True)
@@ -36,6 +81,13 @@ class ProcessWatchdog:
     interval: float = 0.5
     _thread: Optional[threading.Thread] = None
     process_name: str = ""
+    _name_lower: str = field(default="", init=False)
+    _name_bytes: bytes = field(default=b"", init=False)
+    _target_pid: Optional[int] = field(default=None, init=False)
+
+    def __post_init__(self) -> None:
+        self._name_lower = self.process_name.lower()
+        self._name_bytes = self._name_lower.encode()
 
     def start(self) -> None:
         """Start the watchdog thread.
@@ -56,25 +108,86 @@ class ProcessWatchdog:
         If the watched process is no longer detected, the current process
         exits immediately using ``os._exit``.
         """
+        import psutil  # deferred: heavy import, only needed while watching
+
         while True:
-            if not self._houdini_alive():
+            if not self._houdini_alive(psutil):
                 self._cleanup_on_process_exit()
                 os._exit(0)
             time.sleep(self.interval)
 
-    def _houdini_alive(self) -> bool:
+    def _houdini_alive(self, psutil: ModuleType) -> bool:
         """Check whether the target process is currently running.
 
+        The first check scans the process table by name and remembers the
+        matching PID; subsequent ticks reduce to a single
+        ``psutil.pid_exists`` call instead of iterating (and stat-ing)
+        every process twice a second. If the remembered PID disappears,
+        one full re-scan runs before declaring the process dead, in case
+        the PID was recycled or the process restarted.
+
+        Args:
+            psutil: The psutil module (passed in to keep the import lazy).
+
         Returns:
             ``True`` if a running process matches ``process_name``,
             ``False`` otherwise.
         """
+        if self._target_pid is not None:
+            if psutil.pid_exists(self._target_pid):
+                return True
+            self._target_pid = None
+
+        return self._scan_for_target(psutil)
+
+    def _scan_for_target(self, psutil: ModuleType) -> bool:
+        """Scan the process table for the target process by name.
+
+        Args:
+            psutil: The psutil module (passed in to keep the import lazy).
+
+        Returns:
+            ``True`` if a match was found (its PID is remembered),
+            ``False`` otherwise.
+        """
+        if sys.platform.startswith("linux"):
+            return self._linux_scan()
+
+        # process_iter(attrs=...) swallows NoSuchProcess/AccessDenied
+        # itself and leaves None in proc.info, so no per-iteration
+        # try/except is needed here.
+        target = self._name_lower
         for proc in psutil.process_iter(attrs=["name"]):
+            name = proc.info["name"]
+            if name is not None and name.lower() == target:
+                self._target_pid = proc.pid
+                return True
+        return False
+
+    def _linux_scan(self) -> bool:
+        """Scan ``/proc`` directly for the target process.
+
+        Reading ``/proc/<pid>/comm`` is one small read per process,
+        versus the several wrapped file opens psutil performs for each
+        PID. The kernel truncates comm to 15 characters, so the target
+        name is truncated the same way before comparing.
+
+        Returns:
+            ``True`` if a match was found (its PID is remembered),
+            ``False`` otherwise.
+        """
+        target = self._name_bytes[:15]
+        for entry in os.scandir("/proc"):
+            pid = entry.name
+            if not pid.isdigit():
+                continue
             try:
-                if proc.info["name"] and proc.info["name"].lower() == self.process_name:
-                    return True
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
+                with open(f"/proc/{pid}/comm", "rb") as f:
+                    if f.read().strip().lower() == target:
+                        self._target_pid = int(pid)
+                        return True
+            except OSError:
+                continue
         return False
 
     def _cleanup_on_process_exit(self) -> None:
@@ -107,6 +220,7 @@ class DebugpyRuntime:
 
     _started: bool = field(default=False, init=False)
     _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
+    _shutdown: threading.Event = field(default_factory=threading.Event, init=False)
 
     def start(self) -> None:
         """Start the debugpy server if it has not already been started.
@@ -132,17 +246,132 @@ class DebugpyRuntime:
         and starts listening on the configured host and port.
         """
         try:
+            import debugpy
+
+            if self._start_remote_exec():
+                return
+
             debugpy.configure(python=self.python_location.as_posix())
             _, actual_port = debugpy.listen((self.host, self.port))
             logger.info(f"[Houdini] debugpy listening on {self.host}:{actual_port}")
-            self._mark_debugpy_ready()
+            self._register_disconnect_callback()
+            self._mark_debugpy_ready(actual_port)
 
         except Exception:
             logger.exception("[Houdini] debugpy failed")
 
-    def _mark_debugpy_ready(self) -> None:
+    def wait_for_attach(self, timeout: Optional[float] = None) -> bool:
+        """Wait for a debug client to attach without pinning a thread.
+
+        Unlike ``debugpy.wait_for_client()``, which blocks its thread
+        indefinitely, this poll uses load-adaptive parking: a brief busy
+        poll for quick attaches, then ``time.sleep(0)`` yields, then
+        millisecond sleeps. The wait also ends when :meth:`shutdown` is
+        called.
+
+        Args:
+            timeout: Maximum time to wait in seconds, or ``None`` to wait
+                until attach or shutdown.
+
+        Returns:
+            ``True`` if a client attached, ``False`` on timeout or
+            shutdown.
+        """
+        import debugpy
+
+        start = time.monotonic()
+        while not self._shutdown.is_set():
+            if debugpy.is_client_connected():
+                return True
+
+            elapsed = time.monotonic() - start
+            if timeout is not None and elapsed >= timeout:
+                return False
+
+            if elapsed < 0.1:
+                continue
+            elif elapsed < 1.0:
+                time.sleep(0)
+            else:
+                time.sleep(0.001)
+        return False
+
+    def shutdown(self) -> None:
+        """Release any thread blocked in :meth:`wait_for_attach`."""
+        self._shutdown.set()
+
+    def _register_disconnect_callback(self) -> None:
+        """Suspend tracing automatically when the debug client disconnects.
+
+        Registration is best-effort: the disconnect hook is only available
+        on pydevd builds that expose ``add_disconnect_callback``.
+        """
+        try:
+            import pydevd
+
+            debugger = pydevd.get_global_debugger()
+            add_callback = getattr(debugger, "add_disconnect_callback", None)
+            if add_callback is None:
+                logger.debug(
+                    "[Houdini] pydevd has no disconnect callback support"
+                )
+                return
+            add_callback(suspend_tracing)
+        except Exception:
+            logger.exception("[Houdini] failed to register disconnect callback")
+
+    def _start_remote_exec(self) -> bool:
+        """Attach debugpy via PEP 768 ``sys.remote_exec`` when available.
+
+        On Python 3.14+ the interpreter supports injecting a script into a
+        running process without the pydevd ``sys.settrace`` bootstrap, which
+        avoids the persistent per-frame tracing overhead of the classic
+        ``debugpy.listen`` path.
+
+        Returns:
+            ``True`` if the remote-exec attach was initiated, ``False`` if
+            the interpreter does not support it or injection failed (the
+            caller then falls back to ``debugpy.listen``).
+        """
+        if sys.version_info < (3, 14) or not hasattr(sys, "remote_exec"):
+            return False
+
+        try:
+            script_path = self.ready_file.with_name(".debugpy_connect.py")
+            script_path.write_text(
+                f'import debugpy\ndebugpy.connect(("{self.host}", {self.port}))\n',
+                encoding="utf-8",
+            )
+            sys.remote_exec(os.getpid(), str(script_path))
+            logger.info(
+                f"[Houdini] debugpy attached via sys.remote_exec "
+                f"to {self.host}:{self.port}"
+            )
+            self._mark_debugpy_ready(self.port)
+            return True
+        except Exception:
+            logger.exception(
+                "[Houdini] sys.remote_exec attach failed; "
+                "falling back to debugpy.listen"
+            )
+            return False
+
+    def _mark_debugpy_ready(self, port: int) -> None:
+        """Write the ready marker containing the actual bound port.
+
+        ``debugpy.listen`` may be asked for port 0 and bind an ephemeral
+        port, so the marker records the port actually returned by listen
+        rather than the configured one.
+
+        Args:
+            port: Port number the debug adapter is listening on.
+        """
         try:
-            self.ready_file.write_text("ready", encoding="utf-8")
+            # Write-then-rename so a concurrent reader polling for the
+            # marker never observes a partially written (empty) file.
+            tmp = self.ready_file.with_suffix(".tmp")
+            tmp.write_text(str(port), encoding="utf-8")
+            os.replace(tmp, self.ready_file)
             logger.info("[Houdini] debugpy ready marker written")
         except Exception:
             logger.exception("[Houdini] failed to write debugpy ready marker")
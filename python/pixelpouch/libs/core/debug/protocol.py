@@ -0,0 +1,75 @@
+"""Length-prefixed message framing for the send-python TCP protocol.
+
+Each message is a 4-byte big-endian length header followed by the
+payload. Framing removes the previous single ``recv`` with a fixed
+1 MiB buffer, which both truncated larger payloads and allocated the
+full buffer per request; here the receive buffer is sized exactly to
+the announced payload and filled in place with ``recv_into``.
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import socket
+
+_HEADER = struct.Struct(">I")
+
+
+def send_msg(sock: socket.socket, data: bytes) -> None:
+    """Sends one framed message.
+
+    Args:
+        sock: Connected socket to write to.
+        data: Payload bytes.
+    """
+    sock.sendall(_HEADER.pack(len(data)) + data)
+
+
+def recv_msg(sock: socket.socket) -> bytes | None:
+    """Receives one framed message.
+
+    Args:
+        sock: Connected socket to read from.
+
+    Returns:
+        The payload bytes, or ``None`` if the peer closed the connection
+        before a header arrived.
+
+    Raises:
+        ConnectionError: If the connection closes mid-message.
+    """
+    header = _recv_exact(sock, _HEADER.size)
+    if header is None:
+        return None
+    (size,) = _HEADER.unpack(header)
+    body = _recv_exact(sock, size)
+    if body is None:
+        raise ConnectionError("Connection closed mid-message")
+    return body
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes | None:
+    """Reads exactly ``size`` bytes into a single buffer.
+
+    Args:
+        sock: Connected socket to read from.
+        size: Number of bytes to read.
+
+    Returns:
+        The received bytes, or ``None`` if the connection closed before
+        the first byte.
+    """
+    buf = bytearray(size)
+    view = memoryview(buf)
+    received = 0
+    while received < size:
+        n = sock.recv_into(view[received:])
+        if n == 0:
+            if received == 0:
+                return None
+            raise ConnectionError("Connection closed mid-message")
+        received += n
+    return bytes(buf)
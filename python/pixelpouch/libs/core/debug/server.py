@@ -8,29 +8,112 @@ Request/response style Python execution server for DCC (Houdini).
 
 from __future__ import annotations
 
+import hashlib
 import json
 import socket
 import threading
 import traceback
+from collections import OrderedDict
 from contextlib import redirect_stderr, redirect_stdout
 from dataclasses import dataclass, field
 from io import StringIO
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
+from pixelpouch.libs.core.debug.protocol import recv_msg, send_msg
 from pixelpouch.libs.core.logging_factory import PixelPouchLoggerFactory
 
+if TYPE_CHECKING:
+    from types import CodeType
+
+# Same serializer shim as the client: orjson encodes to UTF-8 bytes in
+# native code, stdlib json fills in when unavailable.
+try:
+    import orjson
+
+    def _dumps(obj: object) -> bytes:
+        return orjson.dumps(obj)
+
+    def _loads(data: bytes) -> Any:  # noqa: ANN401
+        return orjson.loads(data)
+
+except ImportError:
+
+    def _dumps(obj: object) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def _loads(data: bytes) -> Any:  # noqa: ANN401
+        return json.loads(data)
+
 logger = PixelPouchLoggerFactory.get_logger(__name__)
 
+# Compiled snippets keyed by a digest of the source. Interactive use
+# re-sends the same code repeatedly; a hit skips the parser/compiler
+# and executes the cached bytecode directly. Bounded LRU so arbitrary
+# one-off snippets cannot grow the cache without limit.
+_CODE_CACHE: OrderedDict[bytes, CodeType] = OrderedDict()
+_CODE_CACHE_MAX = 64
+
+# Pre-rendered skeleton for protocol-level failures: only the traceback
+# varies, so just that string goes through the JSON encoder and is
+# spliced between the literal halves.
+_ERROR_PREFIX = b'{"status":"error","stdout":"","result":null,"stderr":'
+_ERROR_SUFFIX = b"}"
+
+
+def _compile_cached(code: str) -> CodeType:
+    key = hashlib.blake2b(code.encode("utf-8"), digest_size=16).digest()
+    cached = _CODE_CACHE.get(key)
+    if cached is not None:
+        _CODE_CACHE.move_to_end(key)
+        return cached
+
+    compiled = compile(code, "<send>", "exec")
+    _CODE_CACHE[key] = compiled
+    if len(_CODE_CACHE) > _CODE_CACHE_MAX:
+        _CODE_CACHE.popitem(last=False)
+    return compiled
+
+
+class _LazyStringIO:
+    """Write target that only allocates its buffer on first write.
+
+    Most snippets print nothing, so the two capture buffers per request
+    would be pure allocation overhead; this defers the StringIO until
+    something is actually written and reads back as the empty string
+    otherwise.
+    """
+
+    __slots__ = ("_buf",)
+
+    def __init__(self) -> None:
+        self._buf: Optional[StringIO] = None
+
+    def write(self, s: str) -> int:
+        buf = self._buf
+        if buf is None:
+            buf = self._buf = StringIO()
+        return buf.write(s)
+
+    def flush(self) -> None:
+        pass
+
+    def getvalue(self) -> str:
+        return "" if self._buf is None else self._buf.getvalue()
+
 
 @dataclass(slots=True)
 class SendPythonServer:
     host: str = "127.0.0.1"
     port: int = 7001
-    buffer_size: int = 1024 * 1024
+    # When True every request runs in one shared namespace, so imports
+    # and definitions persist across snippets instead of being re-run.
+    # Individual requests can also opt in via {"session": true}.
+    persistent_ns: bool = False
 
     _thread: Optional[threading.Thread] = field(default=None, init=False)
     _started: bool = field(default=False, init=False)
     _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
+    _session_ns: dict[str, Any] = field(default_factory=dict, init=False)
 
     # -------------------------------------------------------------
 
@@ -74,41 +157,53 @@ class SendPythonServer:
     # -------------------------------------------------------------
 
     def _handle_connection(self, conn: socket.socket) -> None:
-        try:
-            payload = conn.recv(self.buffer_size)
-            if not payload:
+        # Serve messages until the peer disconnects, so a persistent
+        # client can reuse one connection for a whole session.
+        while True:
+            try:
+                payload = recv_msg(conn)
+                if not payload:
+                    return
+
+                request = _loads(payload)
+                code = request.get("code")
+
+                if not isinstance(code, str):
+                    raise ValueError("Invalid request: 'code' must be string")
+
+                session = self.persistent_ns or bool(request.get("session"))
+                response = self._execute(code, session=session)
+                send_msg(conn, _dumps(response))
+
+            except Exception:
+                error = _ERROR_PREFIX + _dumps(traceback.format_exc()) + _ERROR_SUFFIX
+                try:
+                    send_msg(conn, error)
+                except OSError:
+                    pass
+                logger.exception("[SendPython] failed to handle request")
                 return
 
-            request = json.loads(payload.decode("utf-8"))
-            code = request.get("code")
-
-            if not isinstance(code, str):
-                raise ValueError("Invalid request: 'code' must be string")
-
-            response = self._execute(code)
-            conn.sendall(json.dumps(response).encode("utf-8"))
-
-        except Exception:
-            error = {
-                "status": "error",
-                "stdout": "",
-                "stderr": traceback.format_exc(),
-                "result": None,
-            }
-            conn.sendall(json.dumps(error).encode("utf-8"))
-            logger.exception("[SendPython] failed to handle request")
-
     # -------------------------------------------------------------
 
-    def _execute(self, code: str) -> dict[str, Any]:
-        stdout_buf = StringIO()
-        stderr_buf = StringIO()
-
-        local_ns: dict[str, Any] = {}
+    def _execute(self, code: str, session: bool = False) -> dict[str, Any]:
+        stdout_buf = _LazyStringIO()
+        stderr_buf = _LazyStringIO()
+
+        if session:
+            # Script-like semantics: globals and locals are the same
+            # shared dict, so definitions survive between requests.
+            local_ns = self._session_ns
+            if "__builtins__" not in local_ns:
+                local_ns["__builtins__"] = __builtins__
+            exec_globals = local_ns
+        else:
+            local_ns = {}
+            exec_globals = globals()
 
         try:
             with redirect_stdout(stdout_buf), redirect_stderr(stderr_buf):
-                exec(code, globals(), local_ns)
+                exec(_compile_cached(code), exec_globals, local_ns)
 
             result = local_ns.get("result")
 
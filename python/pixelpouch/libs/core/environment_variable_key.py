@@ -6,6 +6,7 @@ and access logic avoids hard-coded strings and ensures consistent parsing of
 environment values across the codebase.
 """
 
+import functools
 import os
 from collections.abc import Mapping
 from enum import StrEnum, unique
@@ -65,6 +66,18 @@ class PixelPouchEnvironmentVariables(AppEnvironmentVariables):
     handling to the base AppEnvironmentVariables implementation.
     """
 
+    __slots__ = (
+        "__LOCALAPPDATA",
+        "__USERPROFILE",
+        "__PIXELPOUCH_LOCATION",
+        "__PIXELPOUCH_LOCAL_DATA_DIR",
+        "__PIXELPOUCH_ENV",
+        "__PIXELPOUCH_EXECUTION_CONTEXT",
+        "__PIXELPOUCH_DEBUGGER_ENABLE",
+        "__PIXELPOUCH_HOST",
+        "__PIXELPOUCH_PORT",
+    )
+
     def __init__(self, env: Optional[Mapping[str, str]] = None) -> None:
         """Initializes the environment variable reader.
 
@@ -72,25 +85,27 @@ class PixelPouchEnvironmentVariables(AppEnvironmentVariables):
             env: Optional mapping of environment variables. If not provided,
                 ``os.environ`` is used.
         """
-        self._env: Mapping[str, str] = env if env is not None else os.environ
-        super().__init__(self._env)
+        env = env if env is not None else os.environ
+        super().__init__(env)
 
         self.__LOCALAPPDATA: Path = self._read_path(
-            self._env, EnvironmentVariableKey.LOCALAPPDATA
+            env, EnvironmentVariableKey.LOCALAPPDATA
         )
         self.__USERPROFILE: Path = self._read_path(
-            self._env, EnvironmentVariableKey.USERPROFILE
+            env, EnvironmentVariableKey.USERPROFILE
         )
         self.__PIXELPOUCH_LOCATION: Path = self._read_path(
-            self._env, EnvironmentVariableKey.PIXELPOUCH_LOCATION
+            env, EnvironmentVariableKey.PIXELPOUCH_LOCATION
         ).resolve()
 
+        self.__PIXELPOUCH_LOCAL_DATA_DIR: Path = self.__LOCALAPPDATA / "PixelPouch"
+
         self.__PIXELPOUCH_ENV: str = self._read_str(
-            self._env, EnvironmentVariableKey.PIXELPOUCH_ENV
+            env, EnvironmentVariableKey.PIXELPOUCH_ENV
         )
 
         self.__PIXELPOUCH_EXECUTION_CONTEXT: str = self._read_str(
-            self._env, EnvironmentVariableKey.PIXELPOUCH_EXECUTION_CONTEXT
+            env, EnvironmentVariableKey.PIXELPOUCH_EXECUTION_CONTEXT
         )
 
         # --- debug (always optional attributes) ---
@@ -137,12 +152,13 @@ class PixelPouchEnvironmentVariables(AppEnvironmentVariables):
         """Returns the PixelPouch local data directory.
 
         This directory is derived by appending ``"PixelPouch"`` to the
-        LOCALAPPDATA path.
+        LOCALAPPDATA path. The path is computed once at construction time
+        so repeated accesses do not allocate a new Path object.
 
         Returns:
             The local PixelPouch data directory path.
         """
-        return self.LOCALAPPDATA / "PixelPouch"
+        return self.__PIXELPOUCH_LOCAL_DATA_DIR
 
     @property
     def PIXELPOUCH_LOCATION(self) -> Path:
@@ -201,3 +217,17 @@ class PixelPouchEnvironmentVariables(AppEnvironmentVariables):
             The port number as an integer.
         """
         return self.__PIXELPOUCH_PORT
+
+
+@functools.lru_cache(maxsize=1)
+def get_pixelpouch_environment_variables() -> PixelPouchEnvironmentVariables:
+    """Returns the process-wide accessor for PixelPouch environment variables.
+
+    Environment variables do not change during the process lifetime, so
+    one instance parsed from ``os.environ`` is shared by every caller
+    instead of each module constructing (and re-parsing) its own.
+
+    Returns:
+        The shared PixelPouchEnvironmentVariables instance.
+    """
+    return PixelPouchEnvironmentVariables()
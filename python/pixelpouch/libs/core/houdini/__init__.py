@@ -1,6 +1,11 @@
 from .hou_environment_variables import (
     HoudiniEnvironmentVariableKey,
     HoudiniEnvironmentVariables,
+    get_houdini_environment_variables,
 )
 
-__all__ = ["HoudiniEnvironmentVariables", "HoudiniEnvironmentVariableKey"]
+__all__ = [
+    "HoudiniEnvironmentVariables",
+    "HoudiniEnvironmentVariableKey",
+    "get_houdini_environment_variables",
+]
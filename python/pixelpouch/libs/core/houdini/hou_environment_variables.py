@@ -6,6 +6,7 @@ definitions avoids hard-coded strings and provides consistent parsing and
 typing for paths and path lists used by the application.
 """
 
+import functools
 import os
 from collections.abc import Mapping, Sequence
 from enum import StrEnum, unique
@@ -38,6 +39,14 @@ class HoudiniEnvironmentVariables(AppEnvironmentVariables):
     AppEnvironmentVariables implementation.
     """
 
+    __slots__ = (
+        "__HOUDINI_LOCATION",
+        "__HYTHON_LOCATION",
+        "__HOUDINI_PATH",
+        "__HOUDINI_TOOLBAR_PATH",
+        "__HOUDINI_USER_PREF_DIR",
+    )
+
     def __init__(self, env: Optional[Mapping[str, str]] = None) -> None:
         """Initializes the Houdini environment variable reader.
 
@@ -111,3 +120,17 @@ class HoudiniEnvironmentVariables(AppEnvironmentVariables):
             environment variable.
         """
         return self.__HOUDINI_TOOLBAR_PATH
+
+
+@functools.lru_cache(maxsize=1)
+def get_houdini_environment_variables() -> HoudiniEnvironmentVariables:
+    """Returns the process-wide accessor for Houdini environment variables.
+
+    Environment variables do not change during the process lifetime, so
+    one instance parsed from ``os.environ`` is shared by every caller
+    instead of each module constructing (and re-parsing) its own.
+
+    Returns:
+        The shared HoudiniEnvironmentVariables instance.
+    """
+    return HoudiniEnvironmentVariables()
@@ -20,21 +20,37 @@ from enum import IntEnum
 from pathlib import Path
 from typing import Any, Callable, Mapping, Optional, ParamSpec, TypeAlias, TypeVar, cast
 
-import debugpy
 import yaml
+
+try:
+    # libyaml C parser when the wheel ships it; several times faster
+    # than the pure-Python loader for the startup config parse.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from pixelpouch.libs.core.environment_variable_key import (
-    PixelPouchEnvironmentVariables,
+    get_pixelpouch_environment_variables,
 )
 from pixelpouch.libs.core.utility import (
     Singleton,
     extract_environment_variables,
 )
 
-PP_ENV = PixelPouchEnvironmentVariables()
+PP_ENV = get_pixelpouch_environment_variables()
+
+# Normalized source-root prefix for the exception stack walk in
+# __make_record; PIXELPOUCH_LOCATION is already resolved by the accessor.
+_SRC_DIR = os.path.normcase(str(PP_ENV.PIXELPOUCH_LOCATION)) + os.sep
 
 
 _R = TypeVar("_R")
 _P = ParamSpec("_P")
+
+# Reused per-thread buffer for formatting stack info; exceptions that
+# are thrown and traced repeatedly would otherwise allocate a fresh
+# StringIO each time.
+_tls = threading.local()
 _logging_ArgsType: TypeAlias = tuple[object, ...] | Mapping[str, object]
 _logging_SysExcInfoType: TypeAlias = (
     tuple[type[BaseException] | BaseException | Optional[types.TracebackType]]
@@ -85,6 +101,23 @@ class PixelPouchLogger(logging.getLoggerClass()):  # type: ignore[misc]
         super().__init__(name, level)
 
 
+@functools.lru_cache(maxsize=None)
+def _logger_by_name(name: str) -> PixelPouchLogger:
+    """Returns the logger for ``name``, cached at this module's level.
+
+    ``logging.getLogger`` already caches loggers internally, but behind
+    a lock and a manager lookup; this memo makes repeated factory calls
+    for the same name a plain dict hit.
+
+    Args:
+        name: Logger name.
+
+    Returns:
+        The ``PixelPouchLogger`` registered under ``name``.
+    """
+    return cast("PixelPouchLogger", logging.getLogger(name))
+
+
 class PixelPouchLoggerFactory(Singleton):
     """Singleton factory responsible for logger creation and configuration."""
 
@@ -102,18 +135,17 @@ class PixelPouchLoggerFactory(Singleton):
             A ``PixelPouchLogger`` instance.
         """
         if name is None:
-            frame = inspect.stack()[1]
-            caller = inspect.getmodule(frame[0])
-            assert caller is not None
-            if caller.__package__:
-                name = caller.__package__
-            else:
-                name = caller.__name__
+            # sys._getframe(1) is O(1); inspect.stack() walks and
+            # materializes every frame (with source lookups) just to
+            # reach the immediate caller.
+            caller_globals = sys._getframe(1).f_globals
+            name = caller_globals.get("__package__") or caller_globals.get(
+                "__name__"
+            )
 
         assert name
 
-        logger = logging.getLogger(name)
-        return cast("PixelPouchLogger", logger)
+        return _logger_by_name(name)
 
     __lock = threading.Lock()
     __initialized = False
@@ -126,16 +158,20 @@ class PixelPouchLoggerFactory(Singleton):
         expands environment variables, ensures required directories exist,
         and applies the configuration using ``logging.config.dictConfig``.
         """
-        assert not cls.__initialized
+        # Double-checked locking: after the first call, repeat callers
+        # return on a single attribute read without touching the lock.
+        if cls.__initialized:
+            return
 
         with cls.__lock:
-            assert not cls.__initialized
+            if cls.__initialized:
+                return
             config_path = Path(__file__).parent / "data" / "log_config.yaml"
 
             logging.setLoggerClass(PixelPouchLogger)
 
-            with open(config_path.as_posix(), "rt") as file:
-                data: Any = yaml.safe_load(file.read())
+            with open(config_path, "rt") as file:
+                data: Any = yaml.load(file, Loader=_YamlLoader)
             data = extract_environment_variables(data)
 
             log_path = Path(data["handlers"]["file"]["filename"])
@@ -188,31 +224,33 @@ def __make_record(
             tb = exc_info.__traceback__.tb_next
             exc_info = (type(exc_info), exc_info, tb)
             if stack_info:
-                sio = io.StringIO()
+                sio = getattr(_tls, "sio", None)
+                if sio is None:
+                    sio = _tls.sio = io.StringIO()
+                else:
+                    sio.seek(0)
+                    sio.truncate(0)
                 sio.write("Stack (most recent call last):\n")
 
                 skip = 0
 
-                # src_dir = _resolve_pixelpouch_root()
-                src_dir = PP_ENV.PIXELPOUCH_LOCATION.resolve()
+                # A string prefix test per frame; Path(...).resolve()
+                # here cost syscalls for every frame on the stack.
                 stacks = traceback.extract_stack(tb.tb_frame)
                 for fs in stacks:
-                    fname = Path(fs.filename).resolve()
-                    if fname.is_relative_to(src_dir):
+                    fname = os.path.normcase(os.path.abspath(fs.filename))
+                    if fname.startswith(_SRC_DIR):
                         break
-                    else:
-                        skip = skip + 1
-                        continue
+                    skip = skip + 1
 
                 limit = len(stacks) - skip
 
                 traceback.print_stack(tb.tb_frame, file=sio, limit=limit)
-                sinfo = sio.getvalue()
-                if sinfo[-1] == "\n":
-                    sinfo = sinfo[:-1]
-                sio.close()
+                sinfo = sio.getvalue().rstrip("\n")
         elif not isinstance(exc_info, tuple):
             # exc_info = sys.exc_info()
+            import debugpy  # deferred: avoid importing debugpy at startup
+
             debugpy.breakpoint()
 
     return logger.makeRecord(
@@ -252,19 +290,25 @@ def PixelPouch_trace(
 
     def __decorator(caller_func_or_class: Callable[_P, _R]) -> Callable[_P, _R]:
         """Decorator that applies tracing to a callable."""
-        frame = inspect.stack()[1]
-        caller_module = inspect.getmodule(frame[0])
-        if hasattr(caller_module, "__package__"):
-            name = caller_module.__package__
-        elif hasattr(caller_module, "__name__"):
-            name = caller_module.__name__
-        else:
+        caller_frame = sys._getframe(1)
+        caller_globals = caller_frame.f_globals
+        name = caller_globals.get("__package__") or caller_globals.get("__name__")
+        if not name:
             raise RuntimeError("Failed to get caller name.")
 
-        assert name
+        frame = traceback.FrameSummary(
+            caller_frame.f_code.co_filename,
+            caller_frame.f_lineno,
+            caller_frame.f_code.co_name,
+        )
 
         logger = PixelPouchLoggerFactory.get_logger(name)
 
+        # The messages are static per decorated callable; building them
+        # per call would just re-run the same f-string.
+        enter_msg = f"{caller_func_or_class.__name__}() - Enter"
+        leave_msg = f"{caller_func_or_class.__name__}() - Leave"
+
         @functools.wraps(caller_func_or_class)
         def __wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
             """Wrapped callable with logging and error handling."""
@@ -272,18 +316,24 @@ def PixelPouch_trace(
                 ret = caller_func_or_class(*args, **kwargs)
                 return ret
             else:
+                # Enter/Leave records are DEBUG-only; when the logger is
+                # not enabled for DEBUG the wrapper adds nothing but the
+                # level check. Error records below are kept regardless.
+                debug_enabled = logger.isEnabledFor(LogLevel.DEBUG)
                 try:
-                    # Log - Enter
-                    msg = f"{caller_func_or_class.__name__}() - Enter"
-                    record = __make_record(logger, LogLevel.DEBUG, frame, msg)
-                    logger.handle(record)
+                    if debug_enabled:
+                        record = __make_record(
+                            logger, LogLevel.DEBUG, frame, enter_msg
+                        )
+                        logger.handle(record)
 
                     ret = caller_func_or_class(*args, **kwargs)
 
-                    # Log - Leave
-                    msg = f"{caller_func_or_class.__name__}() - Leave"
-                    record = __make_record(logger, LogLevel.DEBUG, frame, msg)
-                    logger.handle(record)
+                    if debug_enabled:
+                        record = __make_record(
+                            logger, LogLevel.DEBUG, frame, leave_msg
+                        )
+                        logger.handle(record)
 
                     return ret
                 except Exception as ex:
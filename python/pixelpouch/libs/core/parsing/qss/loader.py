@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import os
 import re
+import stat
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -32,10 +34,34 @@ class RootVarPattern:
 
 IMPORT_RULE = ImportRule(pattern=re.compile(r'@import\s+url\("([^"]+)"\);'))
 
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+
+def _read_qss(path: str | os.PathLike[str]) -> str:
+    """Read a QSS file as text, tolerating a UTF-8 BOM.
+
+    Reading the raw bytes and decoding once skips the TextIOWrapper and
+    the stateful utf-8-sig codec, which matters for small sheets read
+    on every cache miss.
+
+    Args:
+        path: Path to the QSS file.
+
+    Returns:
+        Decoded file content without a leading BOM.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:3] == _UTF8_BOM:
+        data = data[3:]
+    return data.decode("utf-8")
+
+# Variable names are ASCII identifiers; re.ASCII keeps \w on the fast
+# byte-class matcher instead of the Unicode tables.
 ROOT_VAR_PATTERN = RootVarPattern(
     root_block=re.compile(r":root\s*\{.*?\}", re.DOTALL),
-    variable=re.compile(r"--([\w-]+)\s*:\s*([^;]+);"),
-    var_call=re.compile(r"var\(\s*--([\w-]+)\s*\)"),
+    variable=re.compile(r"--([\w-]+)\s*:\s*([^;]+);", re.ASCII),
+    var_call=re.compile(r"var\(\s*--([\w-]+)\s*\)", re.ASCII),
 )
 
 
@@ -61,6 +87,18 @@ class QssLoader:
 
     def __init__(self, root: Path) -> None:
         self._root = root.resolve()
+        # Containment prefix for the traversal check, normalized once so
+        # the per-import test is a plain str.startswith.
+        self._root_prefix = os.path.normcase(str(self._root)) + os.sep
+        # Imported file contents keyed by resolved path, invalidated by
+        # mtime like the processed-sheet cache below; themes commonly
+        # @import the same partial from several sheets, and cached
+        # entries have already passed validation.
+        self._import_cache: dict[str, tuple[int, str]] = {}
+        # Fully processed sheets keyed by resolved path, invalidated by
+        # mtime, so reloading an unchanged file is a stat plus a dict
+        # lookup instead of a full read/parse/expand cycle.
+        self._cache: dict[Path, tuple[int, str]] = {}
 
     def load(self, path: Path) -> str:
         """
@@ -77,12 +115,23 @@ class QssLoader:
         """
         path = path.resolve()
 
-        if not path.is_file():
+        # One os.stat serves both the existence check and the cache key.
+        try:
+            st = os.stat(path)
+        except OSError:
+            raise QssLoaderError(f"QSS file not found: {path}") from None
+        if not stat.S_ISREG(st.st_mode):
             raise QssLoaderError(f"QSS file not found: {path}")
+        mtime_ns = st.st_mtime_ns
 
-        content = path.read_text(encoding="utf-8-sig")
+        hit = self._cache.get(path)
+        if hit is not None and hit[0] == mtime_ns:
+            return hit[1]
+
+        content = _read_qss(path)
         content = self._resolve_imports(content, base_dir=path.parent)
         content = self._expand_root_variables(content)
+        self._cache[path] = (mtime_ns, content)
         return content
 
     # -------------------------
@@ -90,29 +139,57 @@ class QssLoader:
     # -------------------------
 
     def _resolve_imports(self, content: str, base_dir: Path) -> str:
-        for match in IMPORT_RULE.pattern.finditer(content):
+        # One substitution pass over the buffer; the previous
+        # finditer + str.replace combination re-scanned the whole
+        # (growing) content once per import rule. Path resolution and
+        # the containment check run on plain strings via os.path, which
+        # avoids building several Path objects per import.
+        base = str(base_dir)
+
+        def replace(match: re.Match[str]) -> str:
             relative_path = match.group(1)
-            target = (base_dir / relative_path).resolve()
-
-            if not target.is_file():
+            target = os.path.realpath(os.path.join(base, relative_path))
+            key = os.path.normcase(target)
+
+            # One os.stat serves the existence check and the cache key,
+            # mirroring load(): an edited partial re-reads, an unchanged
+            # one is a dict hit.
+            try:
+                st = os.stat(target)
+            except OSError:
+                raise QssLoaderError(
+                    f"Imported QSS not found: {relative_path}"
+                ) from None
+            if not stat.S_ISREG(st.st_mode):
                 raise QssLoaderError(f"Imported QSS not found: {relative_path}")
+            mtime_ns = st.st_mtime_ns
+
+            cached = self._import_cache.get(key)
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[1]
 
             # Security: prevent path traversal
-            if not target.is_relative_to(self._root):
+            if not key.startswith(self._root_prefix):
                 raise QssLoaderError(f"Illegal @import path: {relative_path}")
 
-            imported = target.read_text(encoding="utf-8-sig")
-            content = content.replace(match.group(0), imported)
+            imported = _read_qss(target)
+            self._import_cache[key] = (mtime_ns, imported)
+            return imported
 
-        return content
+        return IMPORT_RULE.pattern.sub(replace, content)
 
     def _expand_root_variables(self, content: str) -> str:
         variables: dict[str, str] = {}
 
-        for block in ROOT_VAR_PATTERN.root_block.findall(content):
-            for name, value in ROOT_VAR_PATTERN.variable.findall(block):
+        # Harvest each block's variables and drop the block in the same
+        # substitution pass, instead of findall plus one str.replace
+        # scan per block.
+        def strip_block(m: re.Match[str]) -> str:
+            for name, value in ROOT_VAR_PATTERN.variable.findall(m.group(0)):
                 variables[name] = value.strip()
-            content = content.replace(block, "")
+            return ""
+
+        content = ROOT_VAR_PATTERN.root_block.sub(strip_block, content)
 
         def replacer(m: re.Match[str]) -> str:
             name = m.group(1)
@@ -7,6 +7,12 @@ class QtApplicationError(RuntimeError):
     """Raised when a valid QApplication cannot be obtained."""
 
 
+# The application is a process singleton; once resolved it is returned
+# directly instead of re-querying Qt and re-checking the type on every
+# call from widget factories.
+_cached_app: QtWidgets.QApplication | None = None
+
+
 def get_qapplication(
     *,
     create_if_missing: bool = False,
@@ -33,6 +39,10 @@ def get_qapplication(
             - No Qt application exists and creation is disabled
             - QtWidgets is not available (QCoreApplication only)
     """
+    global _cached_app
+    if _cached_app is not None:
+        return _cached_app
+
     app = QtCore.QCoreApplication.instance()
 
     if app is None:
@@ -41,11 +51,13 @@ def get_qapplication(
                 "QApplication is not initialized and auto-creation is disabled."
             )
 
-        return QtWidgets.QApplication(argv or sys.argv)
+        _cached_app = QtWidgets.QApplication(argv or sys.argv)
+        return _cached_app
 
     if not isinstance(app, QtWidgets.QApplication):
         raise QtApplicationError(
             "QApplication is required, but only QCoreApplication is available."
         )
 
+    _cached_app = app
     return app
@@ -3,7 +3,11 @@ from PySide6 import QtGui, QtWidgets
 
 class WheelTabBar(QtWidgets.QTabBar):
     def wheelEvent(self, event: QtGui.QWheelEvent) -> None:
-        if self.count() == 0:
+        # Wheel events fire at high rates while scrubbing, so the tab
+        # count is queried once and the clamp is inlined instead of
+        # calling max()/min() per tick.
+        count = self.count()
+        if count == 0:
             return
 
         delta = event.angleDelta().y()
@@ -17,7 +21,11 @@ class WheelTabBar(QtWidgets.QTabBar):
         else:
             next_index = current + 1
 
-        next_index = max(0, min(self.count() - 1, next_index))
+        if next_index < 0:
+            next_index = 0
+        elif next_index >= count:
+            next_index = count - 1
+
         if next_index != current:
             self.setCurrentIndex(next_index)
 
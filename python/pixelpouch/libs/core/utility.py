@@ -7,39 +7,212 @@ structures.
 
 from __future__ import annotations
 
+import atexit
+import functools
+import io
 import json
 import os
-import re
 import threading
+import zipfile
 from pathlib import Path
-from typing import Any, Mapping, ParamSpec, Self, TypeAlias
+from typing import Any, Mapping, ParamSpec, Self, TypeAlias, cast
+
+try:
+    # orjson parses in native code, several times faster than the
+    # stdlib for the JSON data files loaded at startup.
+    import orjson
+
+    def _json_loads(data: bytes) -> Any:  # noqa: ANN401
+        return orjson.loads(data)
+
+except ImportError:
+
+    def _json_loads(data: bytes) -> Any:  # noqa: ANN401
+        return json.loads(data)
 
 P = ParamSpec("P")
 
+_CACHED_ZIP_HANDLES: list[zipfile.ZipFile] = []
+
+
+@functools.lru_cache(maxsize=8)
+def open_zip_cached(zip_path_str: str) -> zipfile.ZipFile:
+    """Open a ZIP archive and cache the handle per path.
+
+    Opening a ZipFile re-reads and parses the whole central directory, so
+    repeated per-member opens are O(N * directory-size). Callers that read
+    many members from the same archive should use this helper to reuse a
+    single parsed handle. Cached handles are closed automatically at
+    interpreter exit.
+
+    The underlying file is wrapped in a 1 MiB BufferedReader: archives
+    full of small members otherwise cost several seek/read syscalls per
+    member, most of which a large buffer absorbs.
+
+    Args:
+        zip_path_str: Path to the ZIP archive as a string.
+
+    Returns:
+        An open ``zipfile.ZipFile`` for the given path.
+    """
+    fp = io.BufferedReader(
+        open(zip_path_str, "rb", buffering=0), buffer_size=1 << 20
+    )
+    zf = zipfile.ZipFile(fp)
+    _CACHED_ZIP_HANDLES.append(zf)
+    return zf
+
+
+def _close_cached_zip_handles() -> None:
+    """Close all ZIP handles opened through :func:`open_zip_cached`."""
+    for zf in _CACHED_ZIP_HANDLES:
+        try:
+            zf.close()
+        except Exception:
+            # closing at interpreter exit must never raise
+            pass
+    _CACHED_ZIP_HANDLES.clear()
+
+
+atexit.register(_close_cached_zip_handles)
+
+
+# Guards the one-time installation of a per-class lock in
+# Singleton._locks; never held on the instance fast path.
+_singleton_lock_install = threading.Lock()
+
 
 class Singleton:
     """Thread-safe singleton base class.
 
     This class implements a singleton pattern using per-class locks to ensure
-    that only one instance of each subclass is created.
+    that only one instance of each subclass is created. Once the instance
+    exists, ``__new__`` returns it from a plain dict lookup without taking
+    any lock.
     """
 
     _instances: dict[type, Self] = {}
     _locks: dict[type, threading.Lock] = {}
 
     def __new__(cls, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> Self:
-        if cls not in cls._instances:
-            lock = cls._locks.setdefault(cls, threading.Lock())
-            with lock:
-                if cls not in cls._instances:
-                    instance = super().__new__(cls)
-                    cls._instances[cls] = instance
+        # The created instance is also stashed as a class attribute, so
+        # the steady-state path is one dict hit on the class. Looked up
+        # via cls.__dict__ (not plain attribute access) so a subclass
+        # never inherits its parent's instance through the MRO.
+        instance = cast("Self | None", cls.__dict__.get("_instance"))
+        if instance is not None:
+            return instance
+
+        lock = cls._locks.get(cls)
+        if lock is None:
+            # Rare: install this class's lock exactly once, so the slow
+            # path below never allocates a throwaway Lock per call.
+            with _singleton_lock_install:
+                lock = cls._locks.setdefault(cls, threading.Lock())
+
+        with lock:
+            instance = cls._instances.get(cls)
+            if instance is None:
+                instance = super().__new__(cls)
+                cls._instances[cls] = instance
+                cls._instance = instance
+
+                init = getattr(cls, "__class_init__", None)
+                if callable(init):
+                    init()
+        return instance
+
+    @classmethod
+    def instance(cls) -> Self:
+        """Returns the singleton instance, constructing it on first use.
+
+        Once created, this is a single class-dict read with no locking;
+        before that it falls through to the normal DCLP construction.
+
+        Returns:
+            The singleton instance of this class.
+        """
+        existing = cast("Self | None", cls.__dict__.get("_instance"))
+        if existing is not None:
+            return existing
+        return cls()
 
-                    init = getattr(cls, "__class_init__", None)
-                    if callable(init):
-                        init()
-        return cls._instances[cls]
 
+class EagerSingleton:
+    """Singleton base that constructs the instance at class-definition time.
+
+    For subclasses that are cheap to construct, eager instantiation in
+    ``__init_subclass__`` removes all locking and existence checks from
+    the hot path: ``ClassName()`` reduces to returning a stored
+    attribute. The ``__class_init__`` hook is honored as in
+    :class:`Singleton`, which remains the right base for singletons with
+    expensive construction that should stay lazy.
+    """
+
+    _instance: Self
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+
+        init = getattr(cls, "__class_init__", None)
+        if callable(init):
+            init()
+
+        # object.__new__ is typed as returning the bare class; the cast
+        # reconciles it with the Self-typed attribute.
+        cls._instance = cast("Self", object.__new__(cls))
+
+    def __new__(cls, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> Self:
+        return cls._instance
+
+
+# Characters allowed in a ${VAR} placeholder name; variable names are
+# ASCII by OS convention. str.strip against this set returns "" exactly
+# when every character is allowed, giving a C-level validity test.
+_ENV_VAR_NAME_CHARS = (
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_"
+)
+
+
+def _expand_placeholders(value: str, env: Mapping[str, str]) -> str:
+    """Expand ``${VAR}`` placeholders in a string against ``env``.
+
+    Strings without a placeholder — the overwhelmingly common case —
+    return unchanged after a substring test. The scan itself is a pair
+    of ``str.find`` calls per placeholder; for config values with zero
+    or one placeholder this stays entirely in C-level string ops, with
+    no regex state machine involved.
+
+    Args:
+        value: String possibly containing ``${VAR}`` placeholders.
+        env: Environment mapping used for substitution.
+
+    Returns:
+        The string with each defined variable substituted; undefined
+        placeholders are left as-is.
+    """
+    i = value.find("${")
+    if i < 0:
+        return value
+
+    parts: list[str] = []
+    pos = 0
+    while i >= 0:
+        j = value.find("}", i + 2)
+        if j < 0:
+            break
+        name = value[i + 2 : j]
+        if name and not name.strip(_ENV_VAR_NAME_CHARS):
+            parts.append(value[pos:i])
+            parts.append(env.get(name, value[i : j + 1]))
+            pos = j + 1
+            i = value.find("${", pos)
+        else:
+            # Not a well-formed name; leave the text alone and resume
+            # after the opener (an inner "${" may still be valid).
+            i = value.find("${", i + 2)
+    parts.append(value[pos:])
+    return "".join(parts)
 
 TExtractEnvironmentVariablesArg: TypeAlias = (
     dict[str, "TExtractEnvironmentVariablesArg"]
@@ -49,6 +222,92 @@ TExtractEnvironmentVariablesArg: TypeAlias = (
 )
 
 
+def _has_placeholder(data: TExtractEnvironmentVariablesArg) -> bool:
+    """Return whether any leaf of ``data`` contains a ``${`` marker.
+
+    An explicit worklist with early exit keeps this a cheap pre-scan:
+    no new containers are allocated and the walk stops at the first hit.
+
+    Args:
+        data: Input data to scan for placeholders.
+
+    Returns:
+        ``True`` if any string or ``Path`` leaf contains ``${``.
+    """
+    stack: list[TExtractEnvironmentVariablesArg] = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, str):
+            if "${" in node:
+                return True
+        elif isinstance(node, Path):
+            if "${" in str(node):
+                return True
+    return False
+
+
+def _extract_leaf(
+    data: TExtractEnvironmentVariablesArg,
+    env: Mapping[str, str],
+) -> TExtractEnvironmentVariablesArg:
+    """Expand placeholders in a single non-container value."""
+    if isinstance(data, str):
+        return _expand_placeholders(data, env)
+    elif isinstance(data, Path):
+        old_path = str(data)
+        new_path = _expand_placeholders(old_path, env)
+        if new_path == old_path:
+            return data
+        return Path(new_path)
+    else:
+        return data
+
+
+def _extract(
+    data: TExtractEnvironmentVariablesArg,
+) -> TExtractEnvironmentVariablesArg:
+    """Iterative worker behind :func:`extract_environment_variables`.
+
+    The tree is rebuilt with an explicit worklist of (source, output)
+    container pairs instead of one Python call frame per node; lists are
+    preallocated so elements are assigned by index rather than appended.
+
+    ``os.environ`` is snapshotted into a plain dict once per call:
+    every lookup then costs a single dict hit instead of os._Environ's
+    Python-level get, and the expansion is deterministic even if the
+    environment is mutated mid-call.
+    """
+    env = dict(os.environ)
+
+    if isinstance(data, dict):
+        out: TExtractEnvironmentVariablesArg = {}
+    elif isinstance(data, list):
+        out = [None] * len(data)  # type: ignore[list-item]
+    else:
+        return _extract_leaf(data, env)
+
+    stack: list[tuple[Any, Any]] = [(data, out)]
+    while stack:
+        src, dst = stack.pop()
+        items = src.items() if isinstance(src, dict) else enumerate(src)
+        for key, value in items:
+            if isinstance(value, dict):
+                child: Any = {}
+                dst[key] = child
+                stack.append((value, child))
+            elif isinstance(value, list):
+                child = [None] * len(value)
+                dst[key] = child
+                stack.append((value, child))
+            else:
+                dst[key] = _extract_leaf(value, env)
+    return out
+
+
 def extract_environment_variables(
     data: TExtractEnvironmentVariablesArg,
 ) -> TExtractEnvironmentVariablesArg:
@@ -60,7 +319,8 @@ def extract_environment_variables(
 
     Supported input types are dictionaries, lists, strings, and ``Path``
     objects. Nested structures are processed recursively. Values of other
-    types are returned as-is.
+    types are returned as-is. Trees without a single placeholder — the
+    common case — are returned unchanged after one allocation-free scan.
 
     Args:
         data: Input data that may contain environment variable placeholders.
@@ -69,45 +329,59 @@ def extract_environment_variables(
         The input data with environment variable placeholders expanded, while
         preserving the original data structure and types where possible.
     """
-    pattern = re.compile(r"\${(\w+)}")
-
-    if isinstance(data, dict):
-        return {
-            key: extract_environment_variables(value) for key, value in data.items()
-        }
-    elif isinstance(data, list):
-        return [extract_environment_variables(item) for item in data]
-    elif isinstance(data, str):
-        return pattern.sub(lambda x: os.environ.get(x.group(1), x.group(0)), data)
-    elif isinstance(data, Path):
-        old_path = str(data)
-        new_path = pattern.sub(
-            lambda x: os.environ.get(x.group(1), x.group(0)), old_path
-        )
-        if new_path == old_path:
-            return data
-        return Path(new_path)
-    else:
+    if not _has_placeholder(data):
         return data
+    return _extract(data)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_json(path_str: str, mtime_ns: int) -> dict[str, Any]:
+    """Parses a JSON file, memoized per (path, mtime) pair.
+
+    ``mtime_ns`` is part of the key purely for invalidation: an edited
+    file gets a fresh parse, an unchanged one is a cache hit.
+
+    Args:
+        path_str: Path to the JSON file as a string.
+        mtime_ns: Modification time of the file in nanoseconds.
+
+    Returns:
+        Parsed JSON content.
+    """
+    # Binary read: orjson wants bytes, and json.loads accepts them too.
+    with open(path_str, "rb") as f:
+        parsed: dict[str, Any] = _json_loads(f.read())
+    return parsed
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_category_map(path_str: str, mtime_ns: int) -> dict[str, set[str]]:
+    """Builds the category map, memoized per (path, mtime) pair."""
+    raw: Mapping[str, list[str]] = _cached_json(path_str, mtime_ns)
+    return {category: set(folders) for category, folders in raw.items()}
 
 
 def load_svg_category_map(path: Path) -> dict[str, set[str]]:
     """
     Load SVG category mapping from JSON.
 
+    Results are cached until the file's mtime changes; callers must not
+    mutate the returned mapping.
+
     Returns:
         dict[str, set[str]] mapping category -> folder names
     """
-    with path.open("r", encoding="utf-8") as f:
-        raw: Mapping[str, list[str]] = json.load(f)
-
-    return {category: set(folders) for category, folders in raw.items()}
+    return _cached_category_map(str(path), path.stat().st_mtime_ns)
 
 
 def load_json(path: Path | str) -> dict[str, Any]:
     """
     Load JSON file from disk.
 
+    Results are cached until the file's mtime changes, so startup paths
+    and model refreshes that reload the same file skip the re-parse.
+    Callers must not mutate the returned mapping.
+
     Args:
         path: Path to JSON file.
 
@@ -120,5 +394,4 @@ def load_json(path: Path | str) -> dict[str, Any]:
     """
     if isinstance(path, str):
         path = Path(path)
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return _cached_json(str(path), path.stat().st_mtime_ns)
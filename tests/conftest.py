@@ -0,0 +1,18 @@
+"""Shared test configuration.
+
+Several pixelpouch modules read required environment variables at import
+time, so defaults are seeded here before any test module is collected.
+Variables already set in the environment are left untouched.
+"""
+
+import os
+import tempfile
+
+_tmp = tempfile.gettempdir()
+
+os.environ.setdefault("PIPELINE_LOG_LEVEL", "INFO")
+os.environ.setdefault("LOCALAPPDATA", os.path.join(_tmp, "pixelpouch-tests"))
+os.environ.setdefault("USERPROFILE", os.path.join(_tmp, "pixelpouch-tests"))
+os.environ.setdefault("PIXELPOUCH_LOCATION", _tmp)
+os.environ.setdefault("PIXELPOUCH_ENV", "release")
+os.environ.setdefault("PIXELPOUCH_EXECUTION_CONTEXT", "vscode")
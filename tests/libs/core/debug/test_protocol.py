@@ -0,0 +1,79 @@
+import socket
+import struct
+from collections.abc import Iterator
+
+import pytest
+from pixelpouch.libs.core.debug.protocol import recv_msg, send_msg
+
+
+@pytest.fixture
+def sock_pair() -> Iterator[tuple[socket.socket, socket.socket]]:
+    left, right = socket.socketpair()
+    yield left, right
+    left.close()
+    right.close()
+
+
+def test_round_trip(sock_pair: tuple[socket.socket, socket.socket]) -> None:
+    left, right = sock_pair
+    payload = b'{"code": "result = 1 + 1"}'
+
+    send_msg(left, payload)
+
+    assert recv_msg(right) == payload
+
+
+def test_round_trip_empty_payload(
+    sock_pair: tuple[socket.socket, socket.socket],
+) -> None:
+    left, right = sock_pair
+
+    send_msg(left, b"")
+
+    assert recv_msg(right) == b""
+
+
+def test_multiple_messages_stay_framed(
+    sock_pair: tuple[socket.socket, socket.socket],
+) -> None:
+    left, right = sock_pair
+
+    send_msg(left, b"first")
+    send_msg(left, b"second")
+
+    assert recv_msg(right) == b"first"
+    assert recv_msg(right) == b"second"
+
+
+def test_clean_close_returns_none(
+    sock_pair: tuple[socket.socket, socket.socket],
+) -> None:
+    left, right = sock_pair
+
+    left.close()
+
+    assert recv_msg(right) is None
+
+
+def test_truncated_header_raises(
+    sock_pair: tuple[socket.socket, socket.socket],
+) -> None:
+    left, right = sock_pair
+
+    left.sendall(b"\x00\x00")
+    left.close()
+
+    with pytest.raises(ConnectionError):
+        recv_msg(right)
+
+
+def test_truncated_body_raises(
+    sock_pair: tuple[socket.socket, socket.socket],
+) -> None:
+    left, right = sock_pair
+
+    left.sendall(struct.pack(">I", 10) + b"short")
+    left.close()
+
+    with pytest.raises(ConnectionError):
+        recv_msg(right)